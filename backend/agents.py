@@ -1,5 +1,9 @@
 """Agent registry with LLM client management."""
 
+import sys
+
+import httpx
+import litellm
 from rawagents import AsyncLLM, LLMConfig
 
 from backend.config import settings
@@ -9,13 +13,17 @@ from backend.models import Agent, AgentId
 # AgentId → LiteLLM Model String Mapping
 # =============================================================================
 
+# Keys are interned to match the interned agentId values produced by SlotRequest
 AGENT_MODEL_MAP: dict[str, str] = {
-    "claude-sonnet-4-5": "anthropic/claude-sonnet-4-20250514",
-    "claude-opus-4-5": "anthropic/claude-opus-4-20250514",
-    "gpt-5.2": "openai/gpt-4.1",
-    "gpt-5.1": "openai/gpt-4o",
-    "gpt-4o": "openai/gpt-4o",
-    "gemini-3": "gemini/gemini-2.0-flash",
+    sys.intern(agent_id): model
+    for agent_id, model in {
+        "claude-sonnet-4-5": "anthropic/claude-sonnet-4-20250514",
+        "claude-opus-4-5": "anthropic/claude-opus-4-20250514",
+        "gpt-5.2": "openai/gpt-4.1",
+        "gpt-5.1": "openai/gpt-4o",
+        "gpt-4o": "openai/gpt-4o",
+        "gemini-3": "gemini/gemini-2.0-flash",
+    }.items()
 }
 
 # =============================================================================
@@ -67,6 +75,39 @@ AGENTS: list[Agent] = [
     ),
 ]
 
+# =============================================================================
+# Shared HTTP Connection Pool (created in the app lifespan)
+# =============================================================================
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def start_shared_http_client() -> None:
+    """Create the shared LLM HTTP client (call on application startup).
+
+    Registered as LiteLLM's async client session, which LiteLLM only uses for
+    its OpenAI-compatible and Azure routes: the openai/* agents and any
+    OpenAI-routed sentiment/summary model reuse one keep-alive pool (and its
+    TLS sessions). Anthropic and Gemini calls keep LiteLLM's own clients.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=settings.llm_max_keepalive),
+            timeout=httpx.Timeout(settings.timeout_s, connect=5.0),
+        )
+        litellm.aclient_session = _http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        litellm.aclient_session = None
+
+
 # =============================================================================
 # LLM Client Registry (lazy-initialized)
 # =============================================================================
@@ -55,12 +55,21 @@ Choose based on the emotional quality you sense:
     max_tokens: int = 200  # Concise responses for cleaner cymatic patterns
     timeout_s: int = 60
     retries: int = 3
+    llm_max_keepalive: int = 32  # Idle provider connections kept in the shared pool
 
     # Waves decomposition configuration
     waves_enabled: bool = True
     waves_max_workers: int = 2
     waves_queue_max_size: int = 100
     waves_job_timeout_s: float = 60.0
+    waves_batch_max: int = 4  # Max queued jobs sent to a worker process in one call
+    waves_f0_backend: str = "pyin"  # Pitch tracker: "pyin" or "world" (needs pyworld, much faster)
+    waves_f0_fmin: float = 65.406  # Pitch search floor (C2); raise to ~75 to trim pyin lags if voices allow
+    waves_f0_fmax: float = 523.25  # Pitch search ceiling (C5); retried at C7 if >20% of frames pin
+    waves_processing_sr: int = 8000  # Analysis/output rate (multiple of 8000; 24000 skips resampling TTS)
+    waves_cache_enabled: bool = True  # Reuse decompositions of identical input audio
+    waves_cache_dir: str = "artifacts/waves/cache"
+    waves_cache_max_entries: int = 2000  # LRU cap on cached decompositions (0 = unbounded)
 
     # Events WebSocket configuration (for TouchDesigner)
     events_ws_enabled: bool = True
@@ -88,6 +97,12 @@ Choose based on the emotional quality you sense:
     elevenlabs_default_model: str = "eleven_flash_v2_5"
     tts_output_format: str = "pcm_24000"
     tts_fallback_profile: str = "friendly_casual"
+    tts_concurrency: int = 6  # Max concurrent TTS requests (one per slot)
+    tts_timeout_s: float = 30.0  # Per-request TTS deadline
+    tts_warmup_request: bool = False  # Send a tiny TTS request at startup (warms DNS/TLS, billed)
+    tts_cache_enabled: bool = True  # Reuse audio for identical voice/settings/text
+    tts_cache_dir: str = "artifacts/tts/cache"
+    tts_cache_max_entries: int = 5000  # LRU cap on cached TTS clips (0 = unbounded)
 
     model_config = SettingsConfigDict(
         env_prefix="RR_",
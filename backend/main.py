@@ -1,5 +1,6 @@
 """FastAPI application with SSE streaming for Reflective Resonance."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -9,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from sse_starlette.sse import EventSourceResponse
 
-from backend.agents import AGENTS
+from backend.agents import AGENTS, close_shared_http_client, start_shared_http_client
 from backend.config import settings
 from backend.conversations import reset_all_conversations
 from backend.models import (
@@ -19,8 +20,15 @@ from backend.models import (
     ResetResponse,
 )
 from backend.streaming import broadcast_chat
-from backend.stt import STTResponse, STTSession, ScribeError, get_scribe_client
+from backend.stt import (
+    STTResponse,
+    STTSession,
+    ScribeError,
+    close_scribe_client,
+    get_scribe_client,
+)
 from backend.waves import shutdown_waves_worker, startup_waves_worker
+from backend.workflow import shutdown_tts_executor, warm_up_tts
 from backend.events import events_router, shutdown_events, startup_events
 
 # =============================================================================
@@ -42,12 +50,22 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
     # Startup
+    start_shared_http_client()
+
     logger.info("Starting waves worker pool...")
     await startup_waves_worker()
 
     logger.info("Starting events orchestrator...")
     await startup_events()
 
+    # Build speech clients up front so the first request doesn't pay for it
+    logger.info("Warming up TTS/STT clients...")
+    try:
+        await asyncio.to_thread(warm_up_tts, settings.tts_warmup_request)
+        get_scribe_client()
+    except Exception as e:
+        logger.warning(f"Speech client warm-up skipped: {e}")
+
     yield
 
     # Shutdown
@@ -57,6 +75,10 @@ async def lifespan(app: FastAPI):
     logger.info("Stopping waves worker pool...")
     await shutdown_waves_worker()
 
+    shutdown_tts_executor()
+    await close_shared_http_client()
+    await close_scribe_client()
+
 
 app = FastAPI(
     title="Reflective Resonance API",
@@ -194,8 +216,8 @@ async def speech_to_text(
         raise HTTPException(413, f"File too large ({file_size} bytes). Max: 25MB")
 
     # Create session and save input audio
-    session = STTSession.create()
-    input_path = session.save_input_audio(audio_bytes, ext)
+    session = await STTSession.acreate()
+    input_path = await asyncio.to_thread(session.save_input_audio, audio_bytes, ext)
 
     logger.info(
         f"STT session created: session_id={session.session_id}, "
@@ -218,13 +240,16 @@ async def speech_to_text(
     if not transcript:
         raise HTTPException(422, "No speech detected in audio")
 
-    # Save artifacts
-    session.write_transcript(result, transcript)
-    session.write_metadata(
-        mime_type=content_type,
-        duration_ms=0,  # Could estimate from file size if needed
-        size_bytes=file_size,
-    )
+    # Save artifacts (off the event loop; large responses carry many word timings)
+    def save_artifacts() -> None:
+        session.write_transcript(result, transcript)
+        session.write_metadata(
+            mime_type=content_type,
+            duration_ms=0,  # Could estimate from file size if needed
+            size_bytes=file_size,
+        )
+
+    await asyncio.to_thread(save_artifacts)
 
     logger.info(
         f"STT complete: session_id={session.session_id}, "
@@ -1,9 +1,10 @@
 """Pydantic models for API request/response validation."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from backend.tts.profiles import VoiceProfileName
 
@@ -25,6 +26,12 @@ TurnIndex = Literal[1, 2, 3, 4]
 MessageKind = Literal["response", "comment", "reply", "summary"]
 
 
+# Identifiers stay Literals so they inline into the LLM JSON schema. Validated
+# values are interned so they share identity with the registry keys
+# (AGENT_MODEL_MAP, VOICE_PROFILES) and dict lookups hit the pointer fast path.
+_Interned = AfterValidator(sys.intern)
+
+
 # =============================================================================
 # Request Models
 # =============================================================================
@@ -34,7 +41,7 @@ class SlotRequest(BaseModel):
     """A slot assignment in a chat request."""
 
     slotId: SlotId
-    agentId: AgentId
+    agentId: Annotated[AgentId, _Interned]
 
 
 class ChatRequest(BaseModel):
@@ -58,12 +65,17 @@ class SpokenResponse(BaseModel):
     the text to speak and which voice profile to use.
     """
 
+    # Whitespace-only text fails min_length instead of reaching TTS
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     text: str = Field(
         min_length=1,
         max_length=200,
         description="The spoken response text (1-2 sentences)",
     )
-    voice_profile: VoiceProfileName = Field(description="Voice profile for TTS synthesis")
+    voice_profile: Annotated[VoiceProfileName, _Interned] = Field(
+        description="Voice profile for TTS synthesis"
+    )
 
 
 class CommentSelection(BaseModel):
@@ -72,9 +84,14 @@ class CommentSelection(BaseModel):
     The agent selects exactly one peer response to comment on.
     """
 
+    # Whitespace-only comments fail min_length instead of reaching TTS
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     targetSlotId: int = Field(ge=1, le=6, description="Slot to comment on (1-6, must differ from self)")
     comment: str = Field(min_length=1, max_length=150, description="Single sentence comment")
-    voice_profile: VoiceProfileName = Field(description="Voice profile for TTS synthesis")
+    voice_profile: Annotated[VoiceProfileName, _Interned] = Field(
+        description="Voice profile for TTS synthesis"
+    )
 
 
 # =============================================================================
@@ -114,6 +131,9 @@ class ResetResponse(BaseModel):
 # =============================================================================
 # SSE Event Data Models (3-Turn Workflow)
 # =============================================================================
+# These define the wire schema. The workflow builds them with model_construct()
+# from values it already controls, so events skip the validation pass and go
+# straight to serialization.
 
 
 class TurnStartEvent(BaseModel):
@@ -141,13 +161,6 @@ class SlotStartEvent(BaseModel):
     agentId: str
 
 
-class SlotTokenEvent(BaseModel):
-    """Emitted for each token/chunk during streaming (legacy, not used in 3-turn)."""
-
-    slotId: int
-    content: str
-
-
 class SlotDoneEvent(BaseModel):
     """Emitted when a slot completes successfully."""
 
@@ -205,7 +218,7 @@ class DoneEvent(BaseModel):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn1Result:
     """Result of Turn 1 for a single slot."""
 
@@ -217,7 +230,7 @@ class Turn1Result:
     audio_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn2Result:
     """Result of Turn 2 for a single slot."""
 
@@ -230,7 +243,7 @@ class Turn2Result:
     audio_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn3Result:
     """Result of Turn 3 for a single slot."""
 
@@ -242,7 +255,7 @@ class Turn3Result:
     audio_path: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReceivedComment:
     """A comment received by a slot for Turn 3 input."""
 
@@ -250,8 +263,16 @@ class ReceivedComment:
     from_agent_id: str
     comment: str
 
+    def to_prompt_dict(self) -> dict[str, Any]:
+        """Camel-cased form used by the Turn 3 prompt and the session manifest."""
+        return {
+            "fromSlotId": self.from_slot_id,
+            "fromAgentId": self.from_agent_id,
+            "comment": self.comment,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     """Result of Turn 4 summary generation."""
 
@@ -261,7 +282,7 @@ class SummaryResult:
     audio_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowState:
     """Tracks state across all turns (1-4)."""
 
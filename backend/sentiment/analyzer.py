@@ -45,6 +45,8 @@ async def analyze_sentiment(user_message: str) -> SentimentResult | None:
         llm = get_sentiment_llm()
         prompt = render_sentiment_prompt(user_message)
 
+        # LLMConfig.timeout bounds each attempt; this bounds the whole call
+        # including the retry
         result: SentimentResult = await asyncio.wait_for(
             llm.complete_structured(
                 messages=[{"role": "user", "content": prompt}],
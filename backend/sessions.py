@@ -12,7 +12,9 @@ are stored in the session directory with turn-based subdirectories:
         session.json  # Manifest for TouchDesigner
 """
 
+import asyncio
 import json
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -24,7 +26,7 @@ SESSIONS_BASE = Path("artifacts/tts/sessions")
 TurnIndex = Literal[1, 2, 3]
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSSession:
     """Manages a TTS session and its audio files with 3-turn support."""
 
@@ -35,15 +37,16 @@ class TTSSession:
 
     @classmethod
     def create(cls) -> "TTSSession":
-        """Create a new session with UUID and turn subdirectories."""
+        """Create a new session with UUID.
+
+        Turn subdirectories are created by the audio writers (on the TTS
+        pool) when a turn's first file is written, so sessions that fail
+        early don't leave empty directories behind.
+        """
         session_id = str(uuid.uuid4())
         output_dir = SESSIONS_BASE / session_id
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create turn subdirectories
-        for turn in [1, 2, 3]:
-            (output_dir / f"turn_{turn}").mkdir(exist_ok=True)
-
         session = cls(session_id=session_id, output_dir=output_dir)
 
         # Initialize manifest structure
@@ -59,10 +62,22 @@ class TTSSession:
 
         return session
 
+    @classmethod
+    async def acreate(cls) -> "TTSSession":
+        """Create a new session without blocking the event loop on mkdir."""
+        return await asyncio.to_thread(cls.create)
+
     def get_turn_dir(self, turn_index: TurnIndex) -> Path:
         """Get the directory for a specific turn."""
         return self.output_dir / f"turn_{turn_index}"
 
+    def _audio_paths(self, subdir: str, filename: str) -> tuple[Path, str]:
+        """Build (absolute path, relative path) for one audio file."""
+        return (
+            self.output_dir / subdir / filename,
+            f"tts/sessions/{self.session_id}/{subdir}/{filename}",
+        )
+
     # =========================================================================
     # Turn 1: Response audio paths
     # =========================================================================
@@ -74,15 +89,19 @@ class TTSSession:
 
         Format: turn_1/slot-<N>_<agentId>_<voiceProfile>.wav
         """
-        filename = f"slot-{slot_id}_{agent_id}_{voice_profile}.wav"
-        return self.get_turn_dir(1) / filename
+        return self.get_turn1_paths(slot_id, agent_id, voice_profile)[0]
 
     def get_turn1_relative_path(
         self, slot_id: int, agent_id: str, voice_profile: str
     ) -> str:
         """Get relative path for Turn 1 audio (for SSE events)."""
-        filename = f"slot-{slot_id}_{agent_id}_{voice_profile}.wav"
-        return f"tts/sessions/{self.session_id}/turn_1/{filename}"
+        return self.get_turn1_paths(slot_id, agent_id, voice_profile)[1]
+
+    def get_turn1_paths(
+        self, slot_id: int, agent_id: str, voice_profile: str
+    ) -> tuple[Path, str]:
+        """Get (absolute, relative) paths for Turn 1 audio in one pass."""
+        return self._audio_paths("turn_1", f"slot-{slot_id}_{agent_id}_{voice_profile}.wav")
 
     # =========================================================================
     # Turn 2: Comment audio paths
@@ -99,8 +118,7 @@ class TTSSession:
 
         Format: turn_2/slot-<N>_comment_to_slot-<target>_<agentId>_<voiceProfile>.wav
         """
-        filename = f"slot-{slot_id}_comment_to_slot-{target_slot_id}_{agent_id}_{voice_profile}.wav"
-        return self.get_turn_dir(2) / filename
+        return self.get_turn2_paths(slot_id, target_slot_id, agent_id, voice_profile)[0]
 
     def get_turn2_relative_path(
         self,
@@ -110,8 +128,20 @@ class TTSSession:
         voice_profile: str,
     ) -> str:
         """Get relative path for Turn 2 audio (for SSE events)."""
-        filename = f"slot-{slot_id}_comment_to_slot-{target_slot_id}_{agent_id}_{voice_profile}.wav"
-        return f"tts/sessions/{self.session_id}/turn_2/{filename}"
+        return self.get_turn2_paths(slot_id, target_slot_id, agent_id, voice_profile)[1]
+
+    def get_turn2_paths(
+        self,
+        slot_id: int,
+        target_slot_id: int,
+        agent_id: str,
+        voice_profile: str,
+    ) -> tuple[Path, str]:
+        """Get (absolute, relative) paths for Turn 2 audio in one pass."""
+        return self._audio_paths(
+            "turn_2",
+            f"slot-{slot_id}_comment_to_slot-{target_slot_id}_{agent_id}_{voice_profile}.wav",
+        )
 
     # =========================================================================
     # Turn 3: Reply audio paths
@@ -124,15 +154,19 @@ class TTSSession:
 
         Format: turn_3/slot-<N>_reply_<agentId>_<voiceProfile>.wav
         """
-        filename = f"slot-{slot_id}_reply_{agent_id}_{voice_profile}.wav"
-        return self.get_turn_dir(3) / filename
+        return self.get_turn3_paths(slot_id, agent_id, voice_profile)[0]
 
     def get_turn3_relative_path(
         self, slot_id: int, agent_id: str, voice_profile: str
     ) -> str:
         """Get relative path for Turn 3 audio (for SSE events)."""
-        filename = f"slot-{slot_id}_reply_{agent_id}_{voice_profile}.wav"
-        return f"tts/sessions/{self.session_id}/turn_3/{filename}"
+        return self.get_turn3_paths(slot_id, agent_id, voice_profile)[1]
+
+    def get_turn3_paths(
+        self, slot_id: int, agent_id: str, voice_profile: str
+    ) -> tuple[Path, str]:
+        """Get (absolute, relative) paths for Turn 3 audio in one pass."""
+        return self._audio_paths("turn_3", f"slot-{slot_id}_reply_{agent_id}_{voice_profile}.wav")
 
     # =========================================================================
     # Summary (Turn 4): Summary audio paths
@@ -143,15 +177,15 @@ class TTSSession:
 
         Format: summary/summary_<voiceProfile>.wav
         """
-        summary_dir = self.output_dir / "summary"
-        summary_dir.mkdir(exist_ok=True)
-        filename = f"summary_{voice_profile}.wav"
-        return summary_dir / filename
+        return self.get_summary_paths(voice_profile)[0]
 
     def get_summary_relative_path(self, voice_profile: str) -> str:
         """Get relative path for summary audio (for events)."""
-        filename = f"summary_{voice_profile}.wav"
-        return f"tts/sessions/{self.session_id}/summary/{filename}"
+        return self.get_summary_paths(voice_profile)[1]
+
+    def get_summary_paths(self, voice_profile: str) -> tuple[Path, str]:
+        """Get (absolute, relative) paths for summary audio in one pass."""
+        return self._audio_paths("summary", f"summary_{voice_profile}.wav")
 
     # =========================================================================
     # Manifest management
@@ -230,10 +264,16 @@ class TTSSession:
         }
 
     def write_manifest(self) -> Path:
-        """Write session.json manifest to disk."""
+        """Write session.json manifest to disk.
+
+        Entries accumulate in memory across all turns, so this runs once per
+        session. The file is replaced atomically, so TouchDesigner never reads
+        a partial manifest.
+        """
         manifest_path = self.output_dir / "session.json"
-        with open(manifest_path, "w") as f:
-            json.dump(self._manifest, f, indent=2)
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(self._manifest, indent=2))
+        os.replace(tmp_path, manifest_path)
         return manifest_path
 
     # =========================================================================
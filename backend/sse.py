@@ -0,0 +1,76 @@
+"""Server-Sent Events encoding and multiplexing.
+
+Workflow events are encoded straight to SSE frames (``event:`` + ``data:``)
+and yielded as raw bytes, which ``EventSourceResponse`` writes through
+unchanged. Each event is serialized exactly once, with no intermediate
+``ServerSentEvent`` object or string re-formatting per frame.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator
+
+from pydantic import BaseModel
+
+# Same line separator sse-starlette uses for its own frames (pings)
+_SEP = b"\r\n"
+
+
+def encode_sse(event: str, payload: BaseModel) -> bytes:
+    """Encode a named event with a JSON payload as a complete SSE frame.
+
+    The payload is serialized by pydantic-core straight to bytes (what
+    model_dump_json does before decoding to str), so there is no
+    str round trip per frame.
+    """
+    return (
+        b"event: " + event.encode() + _SEP
+        + b"data: " + payload.__pydantic_serializer__.to_json(payload) + _SEP + _SEP
+    )
+
+
+class SSEChannel:
+    """Single-consumer frame buffer for multiplexing slot events into one stream.
+
+    Producers append synchronously and set one shared ``asyncio.Event``; the
+    consumer drains everything buffered per wakeup. Unlike ``asyncio.Queue``,
+    there is no per-item Future/wakeup round trip, and bursts from concurrent
+    slots are delivered in a single pass.
+    """
+
+    __slots__ = ("_buf", "_ready", "_closed")
+
+    def __init__(self) -> None:
+        self._buf: deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def put(self, frame: bytes) -> None:
+        """Buffer a frame and wake the consumer."""
+        self._buf.append(frame)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Signal that no more frames will be produced."""
+        self._closed = True
+        self._ready.set()
+
+    async def frames(self) -> AsyncGenerator[bytes, None]:
+        """Yield buffered frames until the channel is closed and drained.
+
+        Everything buffered at a wakeup is joined into one chunk, so a burst
+        of events from concurrent slots goes out as a single socket write.
+        """
+        buf = self._buf
+        while True:
+            if len(buf) == 1:
+                yield buf.popleft()
+            elif buf:
+                batch = b"".join(buf)
+                buf.clear()
+                yield batch
+            if self._closed and not buf:
+                return
+            if not buf:
+                self._ready.clear()
+                await self._ready.wait()
@@ -11,8 +11,6 @@ Delegates to workflow.py for orchestration.
 import logging
 from collections.abc import AsyncGenerator
 
-from sse_starlette.sse import ServerSentEvent
-
 from backend.models import SlotRequest
 from backend.workflow import run_three_turn_workflow
 
@@ -22,7 +20,7 @@ logger = logging.getLogger(__name__)
 async def broadcast_chat(
     message: str,
     slots: list[SlotRequest],
-) -> AsyncGenerator[ServerSentEvent, None]:
+) -> AsyncGenerator[bytes, None]:
     """Broadcast message to all slots using 3-turn workflow.
 
     Event flow:
@@ -39,7 +37,7 @@ async def broadcast_chat(
         slots: List of slot requests with slot ID and agent ID
 
     Yields:
-        SSE events for the complete 3-turn workflow
+        Pre-encoded SSE frames for the complete 3-turn workflow
     """
     async for event in run_three_turn_workflow(message, slots):
         yield event
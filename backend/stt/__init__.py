@@ -1,6 +1,11 @@
 """Speech-to-Text (STT) module using ElevenLabs Scribe v1."""
 
-from backend.stt.elevenlabs_stt import ScribeClient, ScribeError, get_scribe_client
+from backend.stt.elevenlabs_stt import (
+    ScribeClient,
+    ScribeError,
+    close_scribe_client,
+    get_scribe_client,
+)
 from backend.stt.models import STTResponse, WordTiming
 from backend.stt.sessions import STTSession
 
@@ -8,6 +13,7 @@ __all__ = [
     "ScribeClient",
     "ScribeError",
     "get_scribe_client",
+    "close_scribe_client",
     "STTResponse",
     "WordTiming",
     "STTSession",
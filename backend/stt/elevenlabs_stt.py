@@ -4,6 +4,7 @@ Uses the ElevenLabs Scribe v1 model for transcription.
 API Reference: https://elevenlabs.io/docs/api-reference/speech-to-text/convert
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -40,6 +41,17 @@ class ScribeClient:
                 "Set RR_ELEVENLABS_API_KEY or ELEVENLABS_API_KEY environment variable."
             )
 
+        # Pooled client reused across transcriptions (TCP/TLS kept alive)
+        self._client = httpx.AsyncClient(
+            timeout=60.0,
+            headers={"xi-api-key": self.api_key},
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
     async def transcribe(
         self,
         audio_path: Path,
@@ -62,27 +74,27 @@ class ScribeClient:
         Raises:
             ScribeError: If the API returns an error
         """
+        # Read off the event loop
+        audio_bytes = await asyncio.to_thread(audio_path.read_bytes)
+
         logger.info(
             f"Transcribing audio: path={audio_path}, "
-            f"size={audio_path.stat().st_size} bytes, "
+            f"size={len(audio_bytes)} bytes, "
             f"language={language_code or 'auto'}"
         )
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            with open(audio_path, "rb") as audio_file:
-                # Build form data
-                files = {"file": (audio_path.name, audio_file)}
-                data: dict[str, str] = {"model_id": SCRIBE_MODEL_ID}
+        # Build form data
+        files = {"file": (audio_path.name, audio_bytes)}
+        data: dict[str, str] = {"model_id": SCRIBE_MODEL_ID}
 
-                if language_code:
-                    data["language_code"] = language_code
+        if language_code:
+            data["language_code"] = language_code
 
-                response = await client.post(
-                    ELEVENLABS_STT_URL,
-                    headers={"xi-api-key": self.api_key},
-                    files=files,
-                    data=data,
-                )
+        response = await self._client.post(
+            ELEVENLABS_STT_URL,
+            files=files,
+            data=data,
+        )
 
         if response.status_code != 200:
             error_text = response.text
@@ -113,3 +125,12 @@ def get_scribe_client() -> ScribeClient:
         logger.info("ScribeClient initialized")
 
     return _client
+
+
+async def close_scribe_client() -> None:
+    """Close the ScribeClient singleton, if created (call on shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -9,6 +9,7 @@ are stored in the session directory:
         metadata.json      # Timing, mime type, etc.
 """
 
+import asyncio
 import json
 import uuid
 from dataclasses import dataclass, field
@@ -36,6 +37,11 @@ class STTSession:
 
         return cls(session_id=session_id, output_dir=output_dir)
 
+    @classmethod
+    async def acreate(cls) -> "STTSession":
+        """Create a new session without blocking the event loop on mkdir."""
+        return await asyncio.to_thread(cls.create)
+
     def get_input_path(self, ext: str) -> Path:
         """Get absolute path for input audio file."""
         return self.output_dir / f"input.{ext}"
@@ -78,8 +84,7 @@ class STTSession:
         if user_agent:
             metadata["userAgent"] = user_agent
 
-        with open(self.get_metadata_path(), "w") as f:
-            json.dump(metadata, f, indent=2)
+        self.get_metadata_path().write_text(json.dumps(metadata, indent=2))
 
     def write_transcript(self, scribe_response: dict[str, Any], plain_text: str) -> None:
         """Write transcript files to disk.
@@ -89,12 +94,10 @@ class STTSession:
             plain_text: Plain text transcript string
         """
         # Write full JSON response
-        with open(self.get_transcript_json_path(), "w") as f:
-            json.dump(scribe_response, f, indent=2)
+        self.get_transcript_json_path().write_text(json.dumps(scribe_response, indent=2))
 
         # Write plain text
-        with open(self.get_transcript_txt_path(), "w") as f:
-            f.write(plain_text)
+        self.get_transcript_txt_path().write_text(plain_text)
 
     def save_input_audio(self, audio_bytes: bytes, ext: str) -> Path:
         """Save uploaded audio to input file.
@@ -2,6 +2,7 @@
 
 from backend.tts.multi_voice_tts import MultiVoiceAgentTTS
 from backend.tts.profiles import (
+    VOICE_PROFILE_NAMES,
     VOICE_PROFILES,
     VoiceProfile,
     VoiceProfileName,
@@ -16,6 +17,7 @@ __all__ = [
     "VoiceProfileName",
     "VoiceSettings",
     "VOICE_PROFILES",
+    "VOICE_PROFILE_NAMES",
     "get_profile",
     "list_profiles",
 ]
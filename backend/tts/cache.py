@@ -0,0 +1,132 @@
+"""Content-addressed on-disk cache for synthesized TTS audio.
+
+Entries are WAV files named by the SHA-256 of everything that determines the
+audio (voice, model, voice settings, output format, text), so identical
+requests across sessions are served from disk without an ElevenLabs call:
+    artifacts/tts/cache/<sha256>.wav
+
+The directory holds at most ``settings.tts_cache_max_entries`` entries; the
+least recently used ones are evicted when a new entry is stored.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from backend.config import settings
+from backend.tts.profiles import VoiceProfile
+
+logger = logging.getLogger(__name__)
+
+_cache_dir: Path | None = None
+
+
+def _get_cache_dir() -> Path:
+    """Get the cache directory, creating it on first use."""
+    global _cache_dir
+    if _cache_dir is None:
+        _cache_dir = Path(settings.tts_cache_dir)
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+    return _cache_dir
+
+
+def cache_key(text: str, profile: VoiceProfile, output_format: str) -> str:
+    """Compute the cache key for a TTS request."""
+    canonical = json.dumps(
+        {
+            "voice_id": profile.voice_id,
+            "model_id": profile.model_id,
+            "settings": profile.settings.model_dump(),
+            "output_format": output_format,
+            "text": text,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def lookup(key: str) -> Path | None:
+    """Return the cached WAV path for a key, or None on miss."""
+    path = _get_cache_dir() / f"{key}.wav"
+    try:
+        # Mark as recently used for eviction
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def load_bytes(key: str) -> bytes | None:
+    """Read a cached WAV, or None if it was evicted since lookup."""
+    try:
+        return (_get_cache_dir() / f"{key}.wav").read_bytes()
+    except OSError:
+        return None
+
+
+def store_bytes(key: str, wav_data: bytes) -> None:
+    """Atomically add WAV bytes to the cache."""
+    cache_dir = _get_cache_dir()
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(wav_data)
+        os.replace(tmp, cache_dir / f"{key}.wav")
+    except OSError as e:
+        logger.warning(f"TTS cache write failed: {e}")
+        Path(tmp).unlink(missing_ok=True)
+        return
+    _evict(cache_dir)
+
+
+def store_file(key: str, src: Path) -> None:
+    """Atomically add an existing WAV file to the cache."""
+    cache_dir = _get_cache_dir()
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, cache_dir / f"{key}.wav")
+    except OSError as e:
+        logger.warning(f"TTS cache write failed: {e}")
+        Path(tmp).unlink(missing_ok=True)
+        return
+    _evict(cache_dir)
+
+
+def copy_to(key: str, dest: Path) -> Path | None:
+    """Materialize a cached entry at dest (hard link when possible).
+
+    Returns:
+        dest, or None if the entry was evicted since lookup
+    """
+    src = _get_cache_dir() / f"{key}.wav"
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        try:
+            shutil.copyfile(src, dest)
+        except FileNotFoundError:
+            return None
+    return dest
+
+
+def _evict(cache_dir: Path) -> None:
+    """Remove the least recently used entries beyond the configured cap."""
+    max_entries = settings.tts_cache_max_entries
+    if max_entries <= 0:
+        return
+    with os.scandir(cache_dir) as it:
+        entries = [e for e in it if e.name.endswith(".wav")]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[: len(entries) - max_entries]:
+        # Session copies are separate links, so this never removes served audio
+        Path(entry.path).unlink(missing_ok=True)
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Iterator
 
 from elevenlabs.client import ElevenLabs
 
@@ -35,12 +36,12 @@ def get_client() -> ElevenLabs:
     return _client
 
 
-def generate_pcm(
+def stream_pcm(
     text: str,
     profile: VoiceProfile,
     output_format: str = "pcm_24000",
-) -> bytes:
-    """Generate PCM audio using ElevenLabs API.
+) -> Iterator[bytes]:
+    """Stream PCM audio chunks from the ElevenLabs API as they arrive.
 
     Args:
         text: Text to convert to speech
@@ -48,7 +49,7 @@ def generate_pcm(
         output_format: ElevenLabs output format (default pcm_24000)
 
     Returns:
-        Raw PCM audio bytes (signed 16-bit LE mono)
+        Iterator of raw PCM chunks (signed 16-bit LE mono)
     """
     client = get_client()
 
@@ -58,7 +59,7 @@ def generate_pcm(
     )
 
     # ElevenLabs convert returns an iterator of bytes
-    audio_generator = client.text_to_speech.convert(
+    return client.text_to_speech.convert(
         text=text,
         voice_id=profile.voice_id,
         model_id=profile.model_id,
@@ -72,9 +73,20 @@ def generate_pcm(
         },
     )
 
-    # Collect all chunks
-    audio_chunks = []
-    for chunk in audio_generator:
-        audio_chunks.append(chunk)
 
-    return b"".join(audio_chunks)
+def generate_pcm(
+    text: str,
+    profile: VoiceProfile,
+    output_format: str = "pcm_24000",
+) -> bytes:
+    """Generate PCM audio using ElevenLabs API.
+
+    Args:
+        text: Text to convert to speech
+        profile: Voice profile with voice_id, model_id, and settings
+        output_format: ElevenLabs output format (default pcm_24000)
+
+    Returns:
+        Raw PCM audio bytes (signed 16-bit LE mono)
+    """
+    return b"".join(stream_pcm(text, profile, output_format))
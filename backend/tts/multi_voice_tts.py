@@ -1,37 +1,41 @@
 """MultiVoiceAgentTTS - TTS system with 6 voice profiles for Reflective Resonance."""
 
+import functools
 import logging
 from pathlib import Path
 
 from backend.config import settings
-from backend.tts.elevenlabs_client import generate_pcm
+from backend.tts import cache
+from backend.tts.elevenlabs_client import generate_pcm, stream_pcm
 from backend.tts.profiles import (
     VoiceProfile,
     get_profile,
     list_profiles,
 )
-from backend.tts.wav import pcm_to_wav, write_wav_file
+from backend.tts.wav import pcm_to_wav, write_wav_stream
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _parse_sample_rate(output_format: str) -> int:
+    """Extract sample rate from format string (e.g., 'pcm_24000' -> 24000)."""
+    parts = output_format.split("_")
+    if len(parts) >= 2:
+        try:
+            return int(parts[1])
+        except ValueError:
+            pass
+    return 24000  # default
+
+
 class MultiVoiceAgentTTS:
     """TTS system with 6 voice profiles for the Reflective Resonance installation."""
 
     def __init__(self) -> None:
         self._fallback_profile = settings.tts_fallback_profile
         self._output_format = settings.tts_output_format
-        self._sample_rate = self._parse_sample_rate(self._output_format)
-
-    def _parse_sample_rate(self, output_format: str) -> int:
-        """Extract sample rate from format string (e.g., 'pcm_24000' -> 24000)."""
-        parts = output_format.split("_")
-        if len(parts) >= 2:
-            try:
-                return int(parts[1])
-            except ValueError:
-                pass
-        return 24000  # default
+        self._sample_rate = _parse_sample_rate(self._output_format)
 
     def list_profiles(self) -> list[str]:
         """List all available voice profile names."""
@@ -68,9 +72,19 @@ class MultiVoiceAgentTTS:
             f"voice={profile.voice_name}, text_len={len(text)}"
         )
 
+        key = None
+        if settings.tts_cache_enabled:
+            key = cache.cache_key(text, profile, self._output_format)
+            if cache.lookup(key) is not None and (wav_data := cache.load_bytes(key)) is not None:
+                logger.info(f"TTS cache hit: {key[:12]}")
+                return wav_data
+
         pcm_data = generate_pcm(text, profile, self._output_format)
         wav_data = pcm_to_wav(pcm_data, sample_rate=self._sample_rate)
 
+        if key is not None:
+            cache.store_bytes(key, wav_data)
+
         logger.info(f"Generated WAV: {len(wav_data)} bytes")
         return wav_data
 
@@ -95,8 +109,18 @@ class MultiVoiceAgentTTS:
 
         logger.info(f"Generating WAV to file: profile={profile_name}, path={path}")
 
-        pcm_data = generate_pcm(text, profile, self._output_format)
-        result_path = write_wav_file(pcm_data, path, sample_rate=self._sample_rate)
+        key = None
+        if settings.tts_cache_enabled:
+            key = cache.cache_key(text, profile, self._output_format)
+            if cache.lookup(key) is not None and cache.copy_to(key, path) is not None:
+                logger.info(f"TTS cache hit: {key[:12]} -> {path}")
+                return path
+
+        pcm_chunks = stream_pcm(text, profile, self._output_format)
+        result_path = write_wav_stream(pcm_chunks, path, sample_rate=self._sample_rate)
+
+        if key is not None:
+            cache.store_file(key, result_path)
 
         logger.info(f"Wrote WAV file: {result_path} ({result_path.stat().st_size} bytes)")
         return result_path
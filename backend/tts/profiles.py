@@ -1,5 +1,7 @@
 """Voice profile definitions for the 6 Reflective Resonance agents."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Literal
 
 from pydantic import BaseModel
@@ -35,7 +37,7 @@ class VoiceProfile(BaseModel):
     settings: VoiceSettings
 
 
-VOICE_PROFILES: dict[VoiceProfileName, VoiceProfile] = {
+_VOICE_PROFILES: dict[VoiceProfileName, VoiceProfile] = {
     "friendly_casual": VoiceProfile(
         name="friendly_casual",
         voice_id="cgSgspJ2msm6clMCkdW9",  # Jessica
@@ -111,13 +113,19 @@ VOICE_PROFILES: dict[VoiceProfileName, VoiceProfile] = {
 }
 
 
+# Read-only view and precomputed names (profiles are fixed at import time)
+VOICE_PROFILES: Mapping[VoiceProfileName, VoiceProfile] = MappingProxyType(_VOICE_PROFILES)
+VOICE_PROFILE_NAMES: tuple[VoiceProfileName, ...] = tuple(_VOICE_PROFILES)
+
+
 def get_profile(name: str) -> VoiceProfile:
     """Get profile by name, raise ValueError if not found."""
-    if name not in VOICE_PROFILES:
-        raise ValueError(f"Unknown profile: {name}. Available: {list(VOICE_PROFILES.keys())}")
-    return VOICE_PROFILES[name]
+    profile = VOICE_PROFILES.get(name)
+    if profile is None:
+        raise ValueError(f"Unknown profile: {name}. Available: {list(VOICE_PROFILE_NAMES)}")
+    return profile
 
 
 def list_profiles() -> list[str]:
     """List all available profile names."""
-    return list(VOICE_PROFILES.keys())
+    return list(VOICE_PROFILE_NAMES)
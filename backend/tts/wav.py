@@ -1,9 +1,29 @@
 """PCM to WAV conversion helper."""
 
-import io
-import wave
+import os
+import struct
+from collections.abc import Iterable
 from pathlib import Path
 
+# Canonical 44-byte PCM RIFF/WAVE header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _build_wav_header(
+    data_len: int,
+    sample_rate: int,
+    channels: int = 1,
+    sample_width: int = 2,
+) -> bytes:
+    """Build the RIFF/WAVE header for data_len bytes of PCM."""
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_len, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b"data", data_len,
+    )
+
 
 def pcm_to_wav(
     pcm_data: bytes,
@@ -22,13 +42,8 @@ def pcm_to_wav(
     Returns:
         WAV file bytes with proper header
     """
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data)
-    return buffer.getvalue()
+    header = _build_wav_header(len(pcm_data), sample_rate, channels, sample_width)
+    return header + pcm_data
 
 
 def write_wav_file(
@@ -49,6 +64,48 @@ def write_wav_file(
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    wav_data = pcm_to_wav(pcm_data, sample_rate)
-    path.write_bytes(wav_data)
+    # Write header and body separately rather than concatenating large buffers
+    with path.open("wb") as f:
+        f.write(_build_wav_header(len(pcm_data), sample_rate))
+        f.write(pcm_data)
+    return path
+
+
+def write_wav_stream(
+    pcm_chunks: Iterable[bytes],
+    path: Path | str,
+    sample_rate: int = 24000,
+) -> Path:
+    """Stream PCM chunks into a WAV file as they arrive.
+
+    A placeholder header is written up front and its sizes are patched once
+    at the end, so the PCM body never has to be buffered in memory. The file
+    is built under a temporary name and renamed into place, so a failed
+    stream never leaves a truncated WAV at path.
+
+    Args:
+        pcm_chunks: Iterable of raw PCM chunks (signed 16-bit little-endian mono)
+        path: Output file path
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Path to written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(_build_wav_header(0, sample_rate))
+            data_len = 0
+            for chunk in pcm_chunks:
+                f.write(chunk)
+                data_len += len(chunk)
+            f.seek(0)
+            f.write(_build_wav_header(data_len, sample_rate))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     return path
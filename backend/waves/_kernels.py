@@ -0,0 +1,98 @@
+"""Numba kernels for wave synthesis.
+
+Each kernel fuses frequency mapping, phase integration and the cosine for all
+N waves into a single pass over the signal, so the voicing test and pitch
+position are computed once per sample and no full-length temporaries are
+allocated.
+
+Output takes the dtype of ``amps`` (float32 in the pipeline); phases are
+accumulated in float64 so long utterances do not drift.
+
+Kernels are compiled lazily on first call and cached to disk (``cache=True``),
+so worker processes after the first load machine code instead of recompiling.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def synth_slots(
+    f0_interp: np.ndarray,
+    min_f0: float,
+    max_f0: float,
+    freq_ranges: np.ndarray,
+    amps: np.ndarray,
+    sr: int,
+) -> np.ndarray:
+    """Synthesize N waves with f0 linearly mapped into per-wave target ranges.
+
+    Args:
+        f0_interp: (T,) f0 at sample rate (<= 0 where unvoiced)
+        min_f0: Minimum voiced f0 of the source
+        max_f0: Maximum voiced f0 of the source
+        freq_ranges: (N, 2) target [min_freq, max_freq] per wave
+        amps: (N, T) amplitude envelope per wave
+        sr: Sample rate
+
+    Returns:
+        (N, T) synthesized waves. Unvoiced samples hold the phase; if the f0
+        range is degenerate every voiced sample uses the range midpoint.
+    """
+    n_waves, n = amps.shape
+    out = np.empty((n_waves, n), dtype=amps.dtype)
+    phases = np.zeros(n_waves)
+    rad_per_hz = 2.0 * math.pi / sr
+    linear = max_f0 > min_f0
+    span_f0 = max_f0 - min_f0
+
+    # Per-wave phase increments (radians/sample) at the bottom of each range,
+    # per unit of pitch position, and at the range midpoint
+    lo = freq_ranges[:, 0] * rad_per_hz
+    span = (freq_ranges[:, 1] - freq_ranges[:, 0]) * rad_per_hz
+    mid = lo + span / 2
+
+    for i in range(n):
+        f0 = f0_interp[i]
+        if f0 > 0:
+            if linear:
+                # Position within the source pitch range, shared by all waves
+                pos = (f0 - min_f0) / span_f0
+                for k in range(n_waves):
+                    phases[k] += lo[k] + pos * span[k]
+            else:
+                for k in range(n_waves):
+                    phases[k] += mid[k]
+        for k in range(n_waves):
+            out[k, i] = amps[k, i] * math.cos(phases[k])
+    return out
+
+
+@njit(cache=True)
+def synth_harmonics(
+    f0_mapped: np.ndarray,
+    amps: np.ndarray,
+    sr: int,
+) -> np.ndarray:
+    """Synthesize N waves at harmonics 1..N of an already-mapped f0 curve.
+
+    Args:
+        f0_mapped: (T,) base frequency curve
+        amps: (N, T) amplitude envelope per harmonic
+        sr: Sample rate
+
+    Returns:
+        (N, T) synthesized waves
+    """
+    n_waves, n = amps.shape
+    out = np.empty((n_waves, n), dtype=amps.dtype)
+    rad_per_hz = 2.0 * math.pi / sr
+    # Harmonic k's phase is exactly k times the fundamental's, so integrate once
+    phase = 0.0
+    for i in range(n):
+        phase += f0_mapped[i] * rad_per_hz
+        for k in range(n_waves):
+            out[k, i] = amps[k, i] * math.cos((k + 1) * phase)
+    return out
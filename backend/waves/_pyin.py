@@ -0,0 +1,267 @@
+"""Compiled pYIN pitch tracker, numerically matching librosa.pyin.
+
+librosa.pyin spends most of its time outside the DSP: rebuilding the
+(2 * n_pitch_bins)^2 HMM transition matrix row by row on every call, and
+scoring YIN troughs frame by frame in Python via scipy.stats. Here the
+transition structure is built once per parameter set (as a sparse predecessor
+list, the same pruning librosa applies with transition_min_prob), and the
+trough scoring and Viterbi decode run as numba kernels.
+
+Only the f0 contour is returned (NaN where unvoiced); librosa's default
+parameters are used throughout.
+"""
+
+import functools
+import math
+
+import librosa
+import numpy as np
+import scipy.fft
+import scipy.stats
+from numba import njit
+from numpy.lib.stride_tricks import sliding_window_view
+
+# librosa.pyin defaults
+N_THRESHOLDS = 100
+BETA_PARAMETERS = (2, 18)
+BOLTZMANN_PARAMETER = 2.0
+RESOLUTION = 0.1
+MAX_TRANSITION_RATE = 35.92
+SWITCH_PROB = 0.01
+NO_TROUGH_PROB = 0.01
+TRANSITION_MIN_PROB = 1e-4
+
+_TINY = np.finfo(np.float64).tiny
+
+
+def _cumulative_mean_normalized_difference(
+    y_frames: np.ndarray, min_period: int, max_period: int
+) -> np.ndarray:
+    """YIN CMND function, (max_period - min_period + 1, n_frames)."""
+    n_pad = scipy.fft.next_fast_len(2 * y_frames.shape[0] - 1, real=True)
+    spectrum = scipy.fft.rfft(y_frames, n=n_pad, axis=0)
+    powspec = spectrum.real**2 + spectrum.imag**2
+    acf_frames = scipy.fft.irfft(powspec, n=n_pad, axis=0)[: max_period + 1]
+
+    # Difference function: d(k) = 2 * (ACF(0) - ACF(k)) - sum_{m=0}^{k-1} y(m)^2
+    yin_frames = np.square(y_frames)
+    np.cumsum(yin_frames, out=yin_frames, axis=0)
+    k = slice(1, max_period + 1)
+    yin_frames[0, :] = 0
+    yin_frames[k, :] = 2 * (acf_frames[0:1, :] - acf_frames[k, :]) - yin_frames[: k.stop - 1, :]
+
+    yin_numerator = yin_frames[min_period : max_period + 1, :]
+    k_range = np.r_[k][:, np.newaxis]
+    cumulative_mean = np.cumsum(yin_frames[k, :], axis=0) / k_range
+    yin_denominator = cumulative_mean[min_period - 1 : max_period, :]
+    return yin_numerator / (yin_denominator + np.finfo(yin_denominator.dtype).tiny)
+
+
+def _parabolic_interpolation(x: np.ndarray) -> np.ndarray:
+    """Parabolic optimum offset per bin along axis 0 (0 at the edges or if >1 bin)."""
+    shifts = np.zeros_like(x)
+    a = x[2:] + x[:-2] - 2 * x[1:-1]
+    b = (x[2:] - x[:-2]) / 2
+    valid = np.abs(b) < np.abs(a)
+    np.divide(-b, a, out=shifts[1:-1], where=valid)
+    return shifts
+
+
+@njit(cache=True)
+def _trough_probs(
+    yin_frames: np.ndarray,
+    thresholds: np.ndarray,
+    beta_probs: np.ndarray,
+    boltzmann_parameter: float,
+    no_trough_prob: float,
+) -> np.ndarray:
+    """Probability mass per YIN trough (pYIN steps 2-5), (n_lags, n_frames)."""
+    n_lags, n_frames = yin_frames.shape
+    n_thr = beta_probs.size
+    yin_probs = np.zeros((n_lags, n_frames), dtype=yin_frames.dtype)
+    trough_index = np.empty(n_lags, dtype=np.int64)
+    counts = np.empty(n_thr, dtype=np.int64)
+    fact = np.empty(n_thr)
+    lam = boltzmann_parameter
+    for i in range(n_frames):
+        x = yin_frames[:, i]
+
+        # Local minima (strict on the left); first/last bins compare one side
+        n_troughs = 0
+        if x[0] < x[1]:
+            trough_index[n_troughs] = 0
+            n_troughs += 1
+        for m in range(1, n_lags - 1):
+            if x[m] < x[m - 1] and x[m] <= x[m + 1]:
+                trough_index[n_troughs] = m
+                n_troughs += 1
+        if x[n_lags - 1] < x[n_lags - 2]:
+            trough_index[n_troughs] = n_lags - 1
+            n_troughs += 1
+        if n_troughs == 0:
+            continue
+
+        # Troughs below each threshold, and the Boltzmann prior normalizer
+        for j in range(n_thr):
+            c = 0
+            for r in range(n_troughs):
+                if x[trough_index[r]] < thresholds[j + 1]:
+                    c += 1
+            counts[j] = c
+            if c > 0:
+                fact[j] = (1 - math.exp(-lam)) / (1 - math.exp(-lam * c))
+
+        global_min = 0
+        for r in range(1, n_troughs):
+            if x[trough_index[r]] < x[trough_index[global_min]]:
+                global_min = r
+
+        # Prior favours smaller periods: position among the troughs below threshold
+        for j in range(n_thr):
+            counts[j] = 0
+        for r in range(n_troughs):
+            height = x[trough_index[r]]
+            prob = 0.0
+            for j in range(n_thr):
+                if height < thresholds[j + 1]:
+                    prob += fact[j] * math.exp(-lam * counts[j]) * beta_probs[j]
+                    counts[j] += 1
+            if r == global_min:
+                below = 0.0
+                for j in range(n_thr):
+                    if not (height < thresholds[j + 1]):
+                        below += beta_probs[j]
+                prob += no_trough_prob * below
+            yin_probs[trough_index[r], i] = prob
+    return yin_probs
+
+
+@njit(cache=True)
+def _viterbi(
+    log_prob: np.ndarray,
+    pred_ptr: np.ndarray,
+    pred_idx: np.ndarray,
+    pred_log_trans: np.ndarray,
+    log_p_init: np.ndarray,
+) -> np.ndarray:
+    """Viterbi decode over a sparse (CSR by destination) transition structure."""
+    n_steps, n_states = log_prob.shape
+    value = np.empty((n_steps, n_states))
+    ptr = np.zeros((n_steps, n_states), dtype=np.uint16)
+    value[0] = log_prob[0] + log_p_init
+    for t in range(1, n_steps):
+        prev = value[t - 1]
+        for j in range(n_states):
+            best_cost = -np.inf
+            best_k = 0
+            for p in range(pred_ptr[j], pred_ptr[j + 1]):
+                k = pred_idx[p]
+                cost = prev[k] + pred_log_trans[p]
+                if cost > best_cost:
+                    best_k = k
+                    best_cost = cost
+            ptr[t, j] = best_k
+            value[t, j] = log_prob[t, j] + best_cost
+
+    state = np.empty(n_steps, dtype=np.int64)
+    state[-1] = np.argmax(value[-1])
+    for t in range(n_steps - 2, -1, -1):
+        state[t] = ptr[t + 1, state[t + 1]]
+    return state
+
+
+@functools.cache
+def _beta_probs() -> tuple[np.ndarray, np.ndarray]:
+    """Threshold grid and its Beta prior."""
+    thresholds = np.linspace(0, 1, N_THRESHOLDS + 1)
+    beta_cdf = scipy.stats.beta.cdf(thresholds, BETA_PARAMETERS[0], BETA_PARAMETERS[1])
+    return thresholds, np.diff(beta_cdf)
+
+
+@functools.cache
+def _transition_model(
+    n_pitch_bins: int, transition_width: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sparse log transition structure for the voiced/unvoiced pitch HMM.
+
+    Returns:
+        (pred_ptr, pred_idx, pred_log_trans, log_p_init): for each destination
+        state j, its feasible predecessors pred_idx[pred_ptr[j]:pred_ptr[j+1]]
+        (ascending) and their log transition probabilities
+    """
+    transition = librosa.sequence.transition_local(
+        n_pitch_bins, transition_width, window="triangle", wrap=False
+    )
+    t_switch = librosa.sequence.transition_loop(2, 1 - SWITCH_PROB)
+    transition = np.kron(t_switch, transition)
+
+    log_trans = np.log(transition + _TINY)
+    feasible = log_trans >= np.log(TRANSITION_MIN_PROB + _TINY)
+    # Transpose so nonzero() walks destinations in order, predecessors ascending
+    dest, src = np.nonzero(feasible.T)
+    pred_ptr = np.zeros(transition.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(dest, minlength=transition.shape[0]), out=pred_ptr[1:])
+
+    n_states = 2 * n_pitch_bins
+    log_p_init = np.log(np.ones(n_states) / n_states + _TINY)
+    return pred_ptr, src.astype(np.int64), log_trans[src, dest], log_p_init
+
+
+def pyin_f0(
+    y: np.ndarray,
+    *,
+    fmin: float,
+    fmax: float,
+    sr: int,
+    frame_length: int = 2048,
+    hop_length: int | None = None,
+) -> np.ndarray:
+    """Estimate f0 with pYIN (same result as librosa.pyin(...)[0]).
+
+    Returns:
+        (n_frames,) f0 in Hz, NaN where unvoiced
+    """
+    if hop_length is None:
+        hop_length = frame_length // 4
+
+    padded = np.pad(y, frame_length // 2)
+    y_frames = sliding_window_view(padded, frame_length)[::hop_length].T
+
+    min_period = int(np.floor(sr / fmax))
+    max_period = min(int(np.ceil(sr / fmin)), frame_length - 1)
+    yin_frames = _cumulative_mean_normalized_difference(y_frames, min_period, max_period)
+    parabolic_shifts = _parabolic_interpolation(yin_frames)
+
+    thresholds, beta_probs = _beta_probs()
+    yin_probs = _trough_probs(
+        np.ascontiguousarray(yin_frames), thresholds, beta_probs, BOLTZMANN_PARAMETER, NO_TROUGH_PROB
+    )
+
+    n_bins_per_semitone = int(np.ceil(1.0 / RESOLUTION))
+    n_pitch_bins = int(np.floor(12 * n_bins_per_semitone * np.log2(fmax / fmin))) + 1
+
+    # Map trough periods (parabolically refined) to pitch bins
+    yin_period, frame_index = np.nonzero(yin_probs)
+    period_candidates = min_period + yin_period + parabolic_shifts[yin_period, frame_index]
+    f0_candidates = sr / period_candidates
+    bin_index = 12 * n_bins_per_semitone * np.log2(f0_candidates / fmin)
+    bin_index = np.clip(np.round(bin_index), 0, n_pitch_bins).astype(int)
+
+    n_frames = yin_frames.shape[1]
+    observation_probs = np.zeros((2 * n_pitch_bins, n_frames))
+    observation_probs[bin_index, frame_index] = yin_probs[yin_period, frame_index]
+    voiced_prob = np.clip(np.sum(observation_probs[:n_pitch_bins, :], axis=0, keepdims=True), 0, 1)
+    observation_probs[n_pitch_bins:, :] = (1 - voiced_prob) / n_pitch_bins
+
+    max_semitones_per_frame = round(MAX_TRANSITION_RATE * 12 * hop_length / sr)
+    transition_width = max_semitones_per_frame * n_bins_per_semitone + 1
+    pred_ptr, pred_idx, pred_log_trans, log_p_init = _transition_model(
+        n_pitch_bins, transition_width
+    )
+    log_prob = np.log(observation_probs.T + _TINY)
+    states = _viterbi(log_prob, pred_ptr, pred_idx, pred_log_trans, log_p_init)
+
+    freqs = fmin * 2 ** (np.arange(n_pitch_bins) / (12 * n_bins_per_semitone))
+    f0 = freqs[states % n_pitch_bins]
+    f0[states >= n_pitch_bins] = np.nan
+    return f0
@@ -0,0 +1,118 @@
+"""Content-addressed on-disk cache for decomposed waves.
+
+Entries are keyed by the SHA-256 of the input WAV bytes plus everything that
+shapes the output (algorithm version, n_waves, target slots, processing rate,
+analysis framing, f0 settings), so a TTS clip that reappears (e.g. a TTS cache
+hit) skips the whole signal-processing pipeline:
+    artifacts/waves/cache/<key>/wave1.wav ... waveN.wav
+    artifacts/waves/cache/<key>/meta.json
+
+The directory holds at most ``settings.waves_cache_max_entries`` entries; the
+least recently used ones are evicted when a new entry is stored.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_META_FILE = "meta.json"
+
+# Bump whenever the decomposition algorithm or its slot/synthesis constants
+# change, so entries written by older code are never served
+_CACHE_VERSION = 2
+
+
+def _get_cache_dir() -> Path:
+    """Get the cache directory, creating it on first use."""
+    cache_dir = Path(settings.waves_cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def cache_key(
+    audio: bytes,
+    n_waves: int,
+    target_slots: list[int] | None,
+    framing: tuple[int, ...],
+) -> str:
+    """Compute the cache key for a decomposition request.
+
+    Args:
+        audio: Input WAV file bytes
+        n_waves: Number of waves requested
+        target_slots: Target slot per wave (None for legacy mapping)
+        framing: Analysis framing constants (hop, n_fft, pyin frame length)
+    """
+    digest = hashlib.sha256(audio).hexdigest()[:32]
+    slots = "-".join(map(str, target_slots)) if target_slots else "legacy"
+    params = (
+        f"{settings.waves_processing_sr}_{'-'.join(map(str, framing))}"
+        f"_{settings.waves_f0_backend}_{settings.waves_f0_fmin:g}-{settings.waves_f0_fmax:g}"
+    )
+    return f"v{_CACHE_VERSION}_{digest}_{n_waves}_{slots}_{params}"
+
+
+def lookup(key: str) -> dict | None:
+    """Return the cached metrics for a key, or None on miss."""
+    entry = _get_cache_dir() / key
+    try:
+        meta = json.loads((entry / _META_FILE).read_text())
+        # Mark as recently used for eviction
+        os.utime(entry)
+    except (OSError, ValueError):
+        return None
+    return meta
+
+
+def copy_to(key: str, dest_paths: list[Path]) -> None:
+    """Materialize cached waves at dest_paths (hard links when possible)."""
+    entry = _get_cache_dir() / key
+    for i, dest in enumerate(dest_paths, start=1):
+        src = entry / f"wave{i}.wav"
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
+
+
+def store(key: str, wave_paths: list[Path], meta: dict) -> None:
+    """Atomically add a decomposition to the cache (failures are logged only)."""
+    cache_dir = _get_cache_dir()
+    tmp = Path(tempfile.mkdtemp(dir=cache_dir, suffix=".tmp"))
+    try:
+        for i, src in enumerate(wave_paths, start=1):
+            shutil.copyfile(src, tmp / f"wave{i}.wav")
+        (tmp / _META_FILE).write_text(json.dumps(meta))
+        os.rename(tmp, cache_dir / key)
+    except OSError as e:
+        # Includes losing a race with another worker storing the same key
+        if not (cache_dir / key).is_dir():
+            logger.warning(f"Waves cache write failed: {e}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        return
+    _evict(cache_dir)
+
+
+def _evict(cache_dir: Path) -> None:
+    """Remove the least recently used entries beyond the configured cap."""
+    max_entries = settings.waves_cache_max_entries
+    if max_entries <= 0:
+        return
+    with os.scandir(cache_dir) as it:
+        entries = [e for e in it if e.is_dir() and not e.name.endswith(".tmp")]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[: len(entries) - max_entries]:
+        # Another worker may be evicting the same entry; session copies are
+        # separate links, so removing an entry never touches served waves
+        shutil.rmtree(entry.path, ignore_errors=True)
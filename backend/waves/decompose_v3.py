@@ -8,15 +8,27 @@ IMPORTANT: This function runs in a subprocess (ProcessPoolExecutor),
 so it must be picklable (module-level function, no closures).
 """
 
+import functools
+import io
 import logging
+import math
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import librosa
 import numpy as np
 import soundfile as sf
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft as scipy_fft
+from scipy.signal import get_window, resample_poly
+
+from backend.config import settings
+from backend.waves import cache as waves_cache
+from backend.waves._kernels import synth_harmonics, synth_slots
+from backend.waves.paths import get_wave_output_paths_n
+from backend.waves.pitch import extract_f0
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +43,18 @@ SLOT_FREQ_RANGES: dict[int, tuple[float, float]] = {
     6: (80.0, 100.0),   # Outer high
 }
 
+# Analysis framing at the 8kHz reference rate. The pitch contour only drives
+# 20-100Hz slot tones, so 256 samples (32ms, ~31 frames/s) is ample and halves
+# pyin/STFT/RMS frame counts versus the original 128. Other processing rates
+# scale these so frame timing and frequency resolution are unchanged.
+REFERENCE_SR = 8000
+HOP_LENGTH = 256
+N_FFT = 512
+PYIN_FRAME_LENGTH = 2048
+
+_write_executor: ThreadPoolExecutor | None = None
+_scratch_buffers: dict[str, np.ndarray] = {}
+
 
 @dataclass
 class DecomposeResult:
@@ -49,89 +73,217 @@ class DecomposeResult:
     duration_ms: float = 0.0  # Processing time
     audio_duration_ms: float = 0.0  # Actual audio duration in milliseconds
 
+    @property
+    def wave1_path(self) -> str | None:
+        """First wave path (2-wave API compatibility)."""
+        return self.wave_paths[0] if self.wave_paths else None
+
+    @property
+    def wave2_path(self) -> str | None:
+        """Second wave path (2-wave API compatibility)."""
+        return self.wave_paths[1] if len(self.wave_paths) > 1 else None
+
 
-def _extract_harmonic_amp(
+def _extract_harmonic_amps(
     S: np.ndarray,
     f0_clean: np.ndarray,
-    harmonic_num: int,
+    voiced: np.ndarray,
+    n_harmonics: int,
     sr: int,
     n_fft: int,
-    freqs: np.ndarray,
-    times_samples: np.ndarray,
-    times_frames: np.ndarray,
 ) -> np.ndarray:
-    """Extract amplitude envelope for a specific harmonic."""
-    target_f = f0_clean * harmonic_num
-    bin_idx = np.round(target_f / (sr / n_fft)).astype(int)
-    bin_idx = np.clip(bin_idx, 0, len(freqs) - 1)
-    frame_indices = np.arange(len(bin_idx))
-    amps = S[bin_idx, frame_indices]
-    amps = amps * (f0_clean > 0).astype(float)
-    amp_interp = np.interp(times_samples, times_frames, amps)
+    """Extract amplitude envelopes for harmonics 1..n_harmonics.
+
+    Harmonic bins of the voiced frames are gathered from S in one
+    advanced-indexing sweep; unvoiced frames (voiced is False) stay zero and
+    are never indexed.
+
+    Returns:
+        (n_harmonics, n_frames) amplitude envelopes at frame rate
+    """
+    voiced_idx = np.flatnonzero(voiced)
+    # Nearest bin in float32 (voiced f0 > 0, so +0.5 and truncation round)
+    harmonics = np.arange(1, n_harmonics + 1, dtype=np.float32)[:, None]
+    bin_pos = f0_clean[voiced_idx] * (harmonics * np.float32(n_fft / sr))
+    bin_pos += np.float32(0.5)
+    bin_idx = bin_pos.astype(np.intp)
+    np.minimum(bin_idx, S.shape[0] - 1, out=bin_idx)
+    amps = np.zeros((n_harmonics, f0_clean.size), dtype=S.dtype)
+    amps[:, voiced_idx] = S[bin_idx, voiced_idx]
 
     # Base normalization (start with x3.0 gain as a baseline)
-    normalization = (2 / 512) * 3.0
-    return amp_interp * normalization
+    amps *= (2 / n_fft) * 3.0
+    return amps
 
 
-def _synthesize_raw(
-    f0_mapped: np.ndarray,
-    freq_multiplier: int,
-    amplitude_env: np.ndarray,
-    sr: int,
-) -> np.ndarray:
-    """Synthesize a raw wave from frequency and amplitude data."""
-    freq_curve = f0_mapped * freq_multiplier
-    phase = np.cumsum(2 * np.pi * freq_curve / sr)
-    wave = amplitude_env * np.cos(phase)
-    return wave
+def _interp_weights(
+    n_samples: int, n_frames: int, hop_length: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Indices and weights for linear frame-rate -> sample-rate interpolation.
 
+    Frame i sits at sample i * hop_length, so both grids are uniform and the
+    bracketing frames follow from a division, with no per-curve search. Like
+    np.interp, values past the last frame hold the last frame's value.
 
-def _calculate_envelope(signal: np.ndarray) -> np.ndarray:
-    """Calculate RMS envelope of a signal."""
-    return librosa.feature.rms(y=signal, frame_length=512, hop_length=128, center=True)[0]
+    Returns:
+        (lo, hi, frac): sample s = curve[lo[s]] + frac[s] * (curve[hi[s]] - curve[lo[s]])
+    """
+    pos = np.arange(n_samples) / hop_length
+    lo = np.minimum(pos.astype(np.intp), max(n_frames - 2, 0))
+    hi = np.minimum(lo + 1, n_frames - 1)
+    frac = np.minimum(pos - lo, 1.0).astype(np.float32)
+    return lo, hi, frac
 
 
-def _synthesize_with_freq_range(
-    f0_interp: np.ndarray,
-    min_f0: float,
-    max_f0: float,
-    target_freq_range: tuple[float, float],
-    amplitude_env: np.ndarray,
-    sr: int,
+def _upsample(
+    curves: np.ndarray, lo: np.ndarray, hi: np.ndarray, frac: np.ndarray
 ) -> np.ndarray:
+    """Interpolate (K, n_frames) curves to (K, n_samples) with shared weights."""
+    low = curves[:, lo]
+    low += (curves[:, hi] - low) * frac
+    return low
+
+
+def _get_write_executor() -> ThreadPoolExecutor:
+    """Get the per-process thread pool used to write wave files."""
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="waves-write")
+    return _write_executor
+
+
+def _load_audio(source: str | io.BytesIO, target_sr: int) -> tuple[np.ndarray, int]:
+    """Load audio as mono float32 at target_sr.
+
+    Resampling uses a polyphase FIR at the reduced rational ratio (TTS is
+    24kHz -> 8kHz, i.e. 1/3; 44.1kHz -> 8kHz is 80/441) instead of librosa's
+    general-purpose resampler.
     """
-    Synthesize a wave with frequency mapped to a target range.
+    y, sr_in = sf.read(source, dtype="float32", always_2d=False)
+    if y.ndim > 1:
+        y = y.mean(axis=1)
+    if sr_in == target_sr:
+        return y, target_sr
+    g = math.gcd(sr_in, target_sr)
+    y = resample_poly(y, target_sr // g, sr_in // g)
+    return y.astype(np.float32, copy=False), target_sr
 
-    Preserves pitch contour: higher original pitch → higher output within range.
 
-    Args:
-        f0_interp: Interpolated f0 at sample rate
-        min_f0: Minimum f0 from original audio
-        max_f0: Maximum f0 from original audio
-        target_freq_range: (min_freq, max_freq) for this wave's target slot
-        amplitude_env: Amplitude envelope (extracted from harmonic)
-        sr: Sample rate
+def _write_wave(out_path: Path, wave: np.ndarray, sr: int) -> None:
+    """Write one 16-bit wave file to a fresh inode.
+
+    out_path may be a hard link into the waves cache (from an earlier hit), so
+    it is unlinked first rather than overwritten in place.
+    """
+    out_path.unlink(missing_ok=True)
+    sf.write(str(out_path), wave, sr, subtype="PCM_16")
+
+
+def _copy_cached(key: str, out_paths: list[Path]) -> bool:
+    """Materialize a cache hit; False if the entry was evicted meanwhile."""
+    try:
+        waves_cache.copy_to(key, out_paths)
+    except OSError:
+        return False
+    return True
+
+
+def _scratch(name: str, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Get a process-local scratch buffer with at least shape[0] rows.
+
+    Buffers are reused across jobs in the same worker and only reallocated
+    (with headroom) when a longer clip arrives. Contents are undefined, and a
+    returned view is only valid until the next call with the same name.
+    """
+    buf = _scratch_buffers.get(name)
+    if buf is None or buf.shape[0] < shape[0] or buf.shape[1:] != shape[1:] or buf.dtype != dtype:
+        buf = np.empty((shape[0] * 5 // 4 + 1, *shape[1:]), dtype=dtype)
+        _scratch_buffers[name] = buf
+    return buf[: shape[0]]
+
+
+@functools.cache
+def _fft_workers() -> int:
+    """FFT threads per process: this worker's share of the cores."""
+    return max(1, (os.cpu_count() or 1) // settings.waves_max_workers)
+
+
+@functools.cache
+def _hann_window(n_fft: int) -> np.ndarray:
+    """Periodic Hann window (librosa.stft's default), as float32."""
+    return get_window("hann", n_fft, fftbins=True).astype(np.float32)
+
+
+def _frame(signal: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Split a signal into centered frames, as librosa stft/rms do with center=True.
 
     Returns:
-        Synthesized wave with frequency in target range
+        (n_frames, n_fft) strided view (no copy)
     """
-    min_freq, max_freq = target_freq_range
+    return sliding_window_view(np.pad(signal, n_fft // 2), n_fft)[::hop_length]
+
+
+def _magnitude_spectrogram(frames: np.ndarray) -> np.ndarray:
+    """Magnitude STFT matching librosa.stft defaults (periodic Hann window).
+
+    All frames are transformed in one batched (multithreaded) float32 real
+    FFT, so there is no per-frame Python work.
+
+    Returns:
+        (1 + n_fft // 2, n_frames) magnitude spectrogram
+    """
+    n_frames, n_fft = frames.shape
+    windowed = _scratch("stft_frames", (n_frames, n_fft), frames.dtype)
+    np.multiply(frames, _hann_window(n_fft), out=windowed)
+    spectrum = scipy_fft.rfft(windowed, axis=1, overwrite_x=True, workers=_fft_workers())
+    magnitude = _scratch("stft_magnitude", (n_frames, n_fft // 2 + 1), frames.dtype)
+    return np.abs(spectrum, out=magnitude).T
+
+
+def _frame_rms(frames: np.ndarray) -> np.ndarray:
+    """RMS per frame, reduced with a single einsum."""
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frames.shape[1])
 
-    # Map f0 to target frequency range (preserving pitch contour)
-    f0_mapped = np.zeros_like(f0_interp)
-    mask = f0_interp > 0
-    if max_f0 > min_f0:
-        # Linear mapping: original pitch range → target frequency range
-        f0_mapped[mask] = min_freq + (f0_interp[mask] - min_f0) / (max_f0 - min_f0) * (max_freq - min_freq)
-    else:
-        # Fallback: use midpoint of range
-        f0_mapped[mask] = (min_freq + max_freq) / 2
 
-    # Synthesize wave (no harmonic multiplication - frequency determined by slot)
-    phase = np.cumsum(2 * np.pi * f0_mapped / sr)
-    wave = amplitude_env * np.cos(phase)
-    return wave
+def _calculate_envelope(signal: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Calculate RMS envelope of a signal (librosa.feature.rms framing)."""
+    return _frame_rms(_frame(signal, n_fft, hop_length))
+
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson correlation of two 1-D arrays (BLAS dots, no 2x2 corrcoef matrix)."""
+    a0 = a - a.mean(dtype=np.float64)
+    b0 = b - b.mean(dtype=np.float64)
+    return float(a0 @ b0 / (np.sqrt((a0 @ a0) * (b0 @ b0)) + 1e-12))
+
+
+def warm_up() -> None:
+    """Run each numerical stage once on a short synthetic signal.
+
+    Triggers numba compilation (or cache load) for the pYIN and synthesis
+    kernels and builds the cached pitch HMM, so the first real job does not
+    pay for it.
+    """
+    sr = settings.waves_processing_sr
+    hop_length = HOP_LENGTH * sr // REFERENCE_SR
+    n_fft = N_FFT * sr // REFERENCE_SR
+    t = np.arange(sr // 2, dtype=np.float32) / sr
+    y = (0.1 * np.sin(2 * np.pi * 150.0 * t)).astype(np.float32)
+
+    extract_f0(
+        y,
+        sr,
+        hop_length,
+        frame_length=PYIN_FRAME_LENGTH * sr // REFERENCE_SR,
+        fmin=settings.waves_f0_fmin,
+        fmax=settings.waves_f0_fmax,
+        backend=settings.waves_f0_backend,
+    )
+    _magnitude_spectrogram(_frame(y, n_fft, hop_length))
+    amps = np.ones((2, y.size), dtype=np.float32)
+    f0 = np.full(y.size, 150.0, dtype=np.float32)
+    synth_slots(f0, 100.0, 200.0, np.array([SLOT_FREQ_RANGES[1], SLOT_FREQ_RANGES[2]]), amps, sr)
+    synth_harmonics(f0, amps, sr)
 
 
 def decompose_audio_to_waves(
@@ -183,29 +335,65 @@ def decompose_audio_to_waves(
 
         # Create output directory
         output_dir_obj.mkdir(parents=True, exist_ok=True)
+        base_name = input_path_obj.stem
+        out_paths = get_wave_output_paths_n(base_name, output_dir_obj, n_waves)
+
+        # Serve previously decomposed audio from the content-addressed cache.
+        # The file is read once: its bytes key the cache and, on a miss, are
+        # decoded in place of a second read.
+        cache_key = None
+        audio_source: str | io.BytesIO = input_path
+        if settings.waves_cache_enabled:
+            audio = input_path_obj.read_bytes()
+            audio_source = io.BytesIO(audio)
+            cache_key = waves_cache.cache_key(
+                audio, n_waves, target_slots, (HOP_LENGTH, N_FFT, PYIN_FRAME_LENGTH)
+            )
+            meta = waves_cache.lookup(cache_key)
+            if meta is not None and _copy_cached(cache_key, out_paths):
+                return DecomposeResult(
+                    success=True,
+                    input_path=input_path,
+                    output_dir=output_dir,
+                    wave_paths=[str(p) for p in out_paths],
+                    n_waves=n_waves,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    **meta,
+                )
 
         # Load audio at processing sample rate
-        processing_sr = 8000
-        y, sr = librosa.load(input_path, sr=processing_sr)
+        processing_sr = settings.waves_processing_sr
+        y, sr = _load_audio(audio_source, processing_sr)
+        hop_length = HOP_LENGTH * sr // REFERENCE_SR
+        n_fft = N_FFT * sr // REFERENCE_SR
 
         # Extract pitch (f0)
-        hop_length = 128
-        f0, voiced_flag, voiced_probs = librosa.pyin(
+        f0 = extract_f0(
             y,
-            fmin=librosa.note_to_hz("C2"),
-            fmax=librosa.note_to_hz("C7"),
-            sr=sr,
-            hop_length=hop_length,
+            sr,
+            hop_length,
+            frame_length=PYIN_FRAME_LENGTH * sr // REFERENCE_SR,
+            fmin=settings.waves_f0_fmin,
+            fmax=settings.waves_f0_fmax,
+            backend=settings.waves_f0_backend,
         )
-        f0_clean = np.nan_to_num(f0)
+        f0_clean = np.nan_to_num(f0).astype(np.float32)
+        voiced = f0_clean > 0
+
+        # Extract harmonic amplitudes (STFT)
+        y_frames = _frame(y, n_fft, hop_length)
+        S = _magnitude_spectrogram(y_frames)
+        amp_frames = _extract_harmonic_amps(S, f0_clean, voiced, n_waves, sr, n_fft)
 
-        # Interpolate f0
-        times_samples = np.arange(len(y)) / sr
-        times_frames = librosa.frames_to_time(np.arange(len(f0)), sr=sr, hop_length=hop_length)
-        f0_interp = np.interp(times_samples, times_frames, f0_clean)
+        # Interpolate f0 and the N amplitude envelopes (used for natural sound
+        # variation) to sample rate in one batched gather
+        lo, hi, frac = _interp_weights(len(y), len(f0_clean), hop_length)
+        curves = _upsample(np.vstack([f0_clean, amp_frames]), lo, hi, frac)
+        f0_interp = curves[0]
+        amp_stack = curves[1:]
 
         # Extract f0 range for frequency mapping
-        valid_f0 = f0_clean[f0_clean > 0]
+        valid_f0 = f0_clean[voiced]
         if len(valid_f0) > 0:
             min_f0 = float(np.min(valid_f0))
             max_f0 = float(np.max(valid_f0))
@@ -228,55 +416,46 @@ def decompose_audio_to_waves(
             mask = f0_interp > 0
             f0_mapped[mask] = 15.0 + (f0_interp[mask] - min_f0) / (max_f0 - min_f0) * (80.0 - 15.0)
 
-        # Extract harmonic amplitudes (STFT)
-        n_fft = 512
-        S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
-        freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
-
-        # Extract amplitude envelopes for N harmonics (used for natural sound variation)
-        amplitudes = []
-        for harmonic_num in range(1, n_waves + 1):
-            amp = _extract_harmonic_amp(
-                S, f0_clean, harmonic_num, sr, n_fft, freqs, times_samples, times_frames
-            )
-            amplitudes.append(amp)
-
-        # Synthesize N raw waves
-        raw_waves = []
-        for i, amp in enumerate(amplitudes):
-            if use_slot_mapping:
-                # NEW: Use slot-specific frequency range
-                target_slot = target_slots[i]
-                freq_range = SLOT_FREQ_RANGES[target_slot]
-                raw_wave = _synthesize_with_freq_range(
-                    f0_interp, min_f0, max_f0, freq_range, amp, sr
-                )
-            else:
-                # Legacy: Use harmonic multiplication with base frequency
-                harmonic_num = i + 1
-                raw_wave = _synthesize_raw(f0_mapped, harmonic_num, amp, sr)
-            raw_waves.append(raw_wave)
+        # Synthesize all N raw waves in one pass: (N, T)
+        if use_slot_mapping:
+            # Map f0 into each target slot's frequency range (preserves contour)
+            freq_ranges = np.array([SLOT_FREQ_RANGES[slot] for slot in target_slots])
+            raw_waves = synth_slots(f0_interp, min_f0, max_f0, freq_ranges, amp_stack, sr)
+        else:
+            # Legacy: Use harmonic multiplication with base frequency
+            raw_waves = synth_harmonics(f0_mapped, amp_stack, sr)
 
-        # Compute raw mix (sum of all waves)
-        raw_mix = np.sum(raw_waves, axis=0)
+        # Compute raw mix (sum of all waves) into a reused buffer; it is only
+        # needed for its envelope, so the final mix below reuses the buffer
+        mix_buffer = _scratch("mix", raw_waves.shape[1:], raw_waves.dtype)
+        raw_mix = raw_waves.sum(axis=0, out=mix_buffer)
 
         # V3 Dynamic Amplitude Matching
-        env_original_frames = _calculate_envelope(y)
-        env_mix_frames = _calculate_envelope(raw_mix)
+        # Same framing as the STFT, so reuse its frames for the source envelope
+        env_original_frames = _frame_rms(y_frames)
+        env_mix_frames = _calculate_envelope(raw_mix, n_fft, hop_length)
 
         # Avoid division by zero
         epsilon = 1e-8
         gain_curve_frames = env_original_frames / (env_mix_frames + epsilon)
 
         # Interpolate gain curve to sample level
-        gain_curve = np.interp(times_samples, times_frames, gain_curve_frames)
+        gain_curve = _upsample(gain_curve_frames[None, :], lo, hi, frac)[0]
 
         # Apply Gain Curve (cap to avoid exploding on silence/noise)
-        gain_curve = np.clip(gain_curve, 0, 10.0)
+        np.clip(gain_curve, 0, 10.0, out=gain_curve)
+
+        # Apply gain to all waves in place: (N, T) final waves
+        final_waves = raw_waves
+        final_waves *= gain_curve
 
-        # Apply gain to all waves
-        final_waves = [raw_wave * gain_curve for raw_wave in raw_waves]
-        mix = np.sum(final_waves, axis=0)
+        # Save N wave files concurrently (libsndfile releases the GIL); the
+        # metrics below only read final_waves, so they overlap with the writes
+        writes = [
+            _get_write_executor().submit(_write_wave, out_path, wave, sr)
+            for wave, out_path in zip(final_waves, out_paths)
+        ]
+        mix = final_waves.sum(axis=0, out=mix_buffer)
 
         # Calculate Loss Metrics
         mse = np.mean((y - mix) ** 2)
@@ -287,21 +466,30 @@ def decompose_audio_to_waves(
         signal_power = np.mean(y ** 2)
         noise_power = mse
         snr_db = float(10 * np.log10(signal_power / (noise_power + 1e-10)))
-        env_mix_final = _calculate_envelope(mix)
+        env_mix_final = _calculate_envelope(mix, n_fft, hop_length)
         min_len = min(len(env_original_frames), len(env_mix_final))
-        env_corr = float(np.corrcoef(env_original_frames[:min_len], env_mix_final[:min_len])[0, 1])
+        env_corr = _pearson(env_original_frames[:min_len], env_mix_final[:min_len])
 
-        # Save N wave files
-        base_name = input_path_obj.stem
-        wave_paths = []
-        for i, wave in enumerate(final_waves):
-            wave_num = i + 1
-            out_path = output_dir_obj / f"{base_name}_v3_wave{wave_num}.wav"
-            sf.write(str(out_path), wave, sr)
-            wave_paths.append(str(out_path))
+        # Wait for the wave files before reporting them
+        for write in writes:
+            write.result()
+        wave_paths = [str(p) for p in out_paths]
 
         # Calculate audio duration from wave length (all waves have same duration)
-        audio_duration_ms = len(final_waves[0]) / sr * 1000 if final_waves else 0.0
+        audio_duration_ms = final_waves.shape[1] / sr * 1000
+
+        if cache_key is not None:
+            waves_cache.store(
+                cache_key,
+                out_paths,
+                {
+                    "rmse": rmse,
+                    "nrmse": float(nrmse),
+                    "snr_db": snr_db,
+                    "env_corr": env_corr,
+                    "audio_duration_ms": audio_duration_ms,
+                },
+            )
 
         duration_ms = (time.time() - start_time) * 1000
 
@@ -328,3 +516,24 @@ def decompose_audio_to_waves(
             error=str(e),
             duration_ms=duration_ms,
         )
+
+
+def decompose_audio_batch(
+    input_paths: list[str],
+    output_dirs: list[str],
+    n_waves: list[int],
+    target_slots: list[list[int] | None],
+) -> list[DecomposeResult]:
+    """Decompose several files in one worker call.
+
+    Takes parallel lists (one entry per job) so a batch crosses the process
+    boundary as a single pickle; each file is processed with
+    decompose_audio_to_waves, reusing this process's warm kernels and buffers.
+
+    Returns:
+        One DecomposeResult per input, in order
+    """
+    return [
+        decompose_audio_to_waves(path, out_dir, n, slots)
+        for path, out_dir, n, slots in zip(input_paths, output_dirs, n_waves, target_slots)
+    ]
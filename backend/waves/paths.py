@@ -49,10 +49,8 @@ def get_wave_output_paths(base_name: str, output_dir: Path) -> tuple[Path, Path]
     Returns:
         Tuple of (wave1_path, wave2_path)
     """
-    return (
-        output_dir / f"{base_name}_v3_wave1.wav",
-        output_dir / f"{base_name}_v3_wave2.wav",
-    )
+    wave1_path, wave2_path = get_wave_output_paths_n(base_name, output_dir, 2)
+    return wave1_path, wave2_path
 
 
 def get_wave_output_paths_n(base_name: str, output_dir: Path, n_waves: int) -> list[Path]:
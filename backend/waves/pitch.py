@@ -0,0 +1,103 @@
+"""Fundamental frequency (f0) extraction for wave decomposition.
+
+The decomposition only needs a coarse pitch contour (it is mapped onto
+20-100Hz slot ranges), so a faster estimator can replace librosa's pYIN,
+which dominates decomposition wallclock.
+
+Backends (``settings.waves_f0_backend``):
+- "pyin": compiled pYIN, identical to librosa.pyin (default, no extra dependency)
+- "world": pyworld DIO + StoneMask (requires ``pip install pyworld``)
+"""
+
+import logging
+
+import librosa
+import numpy as np
+
+from backend.waves._pyin import pyin_f0
+
+logger = logging.getLogger(__name__)
+
+# Default pitch search range (also used as the DIO floor/ceiling). Speech
+# sits well below C5, so that is the default ceiling; F0_MAX_FALLBACK is used
+# when too many voiced frames pin at the lower ceiling.
+F0_MIN = float(librosa.note_to_hz("C2"))
+F0_MAX_FALLBACK = float(librosa.note_to_hz("C7"))
+CEILING_HIT_RATIO = 0.2
+
+_warned_missing_pyworld = False
+
+
+def _f0_pyin(
+    y: np.ndarray, sr: int, hop_length: int, frame_length: int, fmin: float, fmax: float
+) -> np.ndarray:
+    return pyin_f0(
+        y,
+        fmin=fmin,
+        fmax=fmax,
+        sr=sr,
+        frame_length=frame_length,
+        hop_length=hop_length,
+    )
+
+
+def _f0_world(
+    y: np.ndarray, sr: int, hop_length: int, fmin: float, fmax: float
+) -> np.ndarray:
+    import pyworld
+
+    x = y.astype(np.float64)
+    frame_period = hop_length / sr * 1000
+    f0, t = pyworld.dio(x, sr, f0_floor=fmin, f0_ceil=fmax, frame_period=frame_period)
+    f0 = pyworld.stonemask(x, f0, t, sr)
+
+    # Align to librosa's centered frame grid (frame i at i * hop_length)
+    n_frames = 1 + len(y) // hop_length
+    if len(f0) < n_frames:
+        f0 = np.pad(f0, (0, n_frames - len(f0)))
+    return f0[:n_frames]
+
+
+def extract_f0(
+    y: np.ndarray,
+    sr: int,
+    hop_length: int,
+    frame_length: int = 2048,
+    fmin: float = F0_MIN,
+    fmax: float = F0_MAX_FALLBACK,
+    backend: str = "pyin",
+) -> np.ndarray:
+    """Extract an f0 contour on librosa's frame grid.
+
+    Args:
+        y: Mono audio signal
+        sr: Sample rate
+        hop_length: Hop between frames in samples
+        frame_length: pyin analysis window in samples
+        fmin: Pitch search floor in Hz
+        fmax: Pitch search ceiling in Hz (retried at C7 if pinned)
+        backend: "pyin" or "world" (falls back to "pyin" if pyworld is missing)
+
+    Returns:
+        (1 + len(y) // hop_length,) f0 in Hz; unvoiced frames are NaN or 0
+    """
+    global _warned_missing_pyworld
+    if backend == "world":
+        try:
+            return _f0_world(y, sr, hop_length, fmin, fmax)
+        except ImportError:
+            if not _warned_missing_pyworld:
+                logger.warning("pyworld not installed, falling back to pyin for f0")
+                _warned_missing_pyworld = True
+    elif backend != "pyin":
+        raise ValueError(f"Unknown f0 backend: {backend}")
+
+    f0 = _f0_pyin(y, sr, hop_length, frame_length, fmin, fmax)
+    if fmax < F0_MAX_FALLBACK:
+        # pyin quantizes to 10-cent bins; anything within a bin of fmax is pinned
+        voiced = f0[f0 > 0]
+        pinned = np.count_nonzero(voiced >= fmax * 2 ** (-0.1 / 12))
+        if voiced.size and pinned > CEILING_HIT_RATIO * voiced.size:
+            logger.debug(f"f0 pinned at {fmax:.0f}Hz in {pinned}/{voiced.size} frames, widening")
+            f0 = _f0_pyin(y, sr, hop_length, frame_length, fmin, F0_MAX_FALLBACK)
+    return f0
@@ -6,17 +6,49 @@ in the background using a ProcessPoolExecutor for CPU-bound work.
 
 import asyncio
 import logging
+import multiprocessing as mp
 import time
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
-from backend.waves.decompose_v3 import DecomposeResult, decompose_audio_to_waves
+from backend.waves.decompose_v3 import DecomposeResult, decompose_audio_batch, warm_up
 
 logger = logging.getLogger(__name__)
 
 
+def _init_worker() -> None:
+    """Process pool initializer: compile/load JIT code before the first job."""
+    try:
+        warm_up()
+    except Exception as e:
+        # Never break the pool over warm-up; the first job just runs cold
+        logger.warning(f"Waves worker warm-up failed: {e}")
+
+
+def _noop() -> None:
+    """Trivial task used to start worker processes eagerly."""
+
+
+def _mp_context() -> mp.context.BaseContext:
+    """Use forkserver where available, with the decomposition stack preloaded.
+
+    The server imports librosa/numba/scipy once and every worker forks from it,
+    so workers neither re-import (spawn) nor inherit the app's threads (fork).
+    """
+    if "forkserver" not in mp.get_all_start_methods():
+        return mp.get_context()
+    ctx = mp.get_context("forkserver")
+    ctx.set_forkserver_preload(["backend.waves.decompose_v3"])
+    return ctx
+
+
+def _job_files(jobs: list["DecomposeJob"]) -> str:
+    """Comma-separated input file names of a batch (for logging)."""
+    return ", ".join(job.input_path.name for job in jobs)
+
+
 @dataclass
 class DecomposeJob:
     """Job to be processed by the decomposition worker."""
@@ -56,6 +88,7 @@ class WavesWorkerPool:
         max_workers: int = 2,
         queue_max_size: int = 100,
         job_timeout_s: float = 60.0,
+        batch_max: int = 4,
     ):
         """Initialize the worker pool.
 
@@ -63,10 +96,12 @@ class WavesWorkerPool:
             max_workers: Number of ProcessPoolExecutor workers
             queue_max_size: Maximum queue size (jobs dropped when full)
             job_timeout_s: Timeout for each decomposition job
+            batch_max: Maximum jobs sent to a worker process in one call
         """
         self._max_workers = max_workers
         self._queue_max_size = queue_max_size
         self._job_timeout_s = job_timeout_s
+        self._batch_max = max(1, batch_max)
 
         self._executor: ProcessPoolExecutor | None = None
         self._queue: asyncio.Queue[DecomposeJob | None] | None = None
@@ -101,7 +136,14 @@ class WavesWorkerPool:
             f"queue_size={self._queue_max_size}, timeout={self._job_timeout_s}s"
         )
 
-        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=_mp_context(),
+            initializer=_init_worker,
+        )
+        # Start (and warm up) all worker processes now rather than on first job
+        for _ in range(self._max_workers):
+            self._executor.submit(_noop)
         self._queue = asyncio.Queue(maxsize=self._queue_max_size)
         self._running = True
 
@@ -172,6 +214,10 @@ class WavesWorkerPool:
     async def _worker_loop(self, worker_id: int) -> None:
         """Process jobs from queue.
 
+        Jobs already waiting in the queue are batched (up to batch_max) into a
+        single executor call, leaving enough behind to keep the other workers
+        busy. A lone job is never held back waiting for company.
+
         Args:
             worker_id: Identifier for this worker (for logging)
         """
@@ -191,80 +237,104 @@ class WavesWorkerPool:
                     logger.debug(f"Worker {worker_id} received shutdown signal")
                     break
 
-                # Process the job
-                await self._process_job(loop, worker_id, job)
+                jobs = [job]
+                shutdown = False
+                while len(jobs) < self._batch_max and self._queue.qsize() >= self._max_workers:
+                    next_job = self._queue.get_nowait()
+                    if next_job is None:
+                        shutdown = True
+                        break
+                    jobs.append(next_job)
+
+                # Process the batch
+                await self._process_batch(loop, worker_id, jobs)
+
+                if shutdown:
+                    logger.debug(f"Worker {worker_id} received shutdown signal")
+                    break
 
             except Exception as e:
                 logger.error(f"Worker {worker_id} unexpected error: {e}")
 
         logger.debug(f"Worker {worker_id} stopped")
 
-    async def _process_job(
+    async def _process_batch(
         self,
         loop: asyncio.AbstractEventLoop,
         worker_id: int,
-        job: DecomposeJob,
+        jobs: list[DecomposeJob],
     ) -> None:
-        """Process a single decomposition job.
+        """Process a batch of decomposition jobs in one executor call.
 
         Args:
             loop: The event loop
             worker_id: Identifier for this worker
-            job: The job to process
+            jobs: The jobs to process
         """
+        timeout_s = self._job_timeout_s * len(jobs)
         try:
-            logger.debug(
-                f"Worker {worker_id} processing: session={job.session_id}, "
-                f"turn={job.turn_index}, file={job.input_path.name}"
-            )
+            # Per-job hot path: skip building the message when DEBUG is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Worker {worker_id} processing {len(jobs)} job(s): {_job_files(jobs)}"
+                )
 
             # Run CPU-bound decomposition in process pool with timeout
-            result: DecomposeResult = await asyncio.wait_for(
+            results: list[DecomposeResult] = await asyncio.wait_for(
                 loop.run_in_executor(
                     self._executor,
-                    decompose_audio_to_waves,
-                    str(job.input_path),
-                    str(job.output_dir),
-                    job.n_waves,
-                    job.target_slots,  # Pass target slots for frequency mapping
+                    decompose_audio_batch,
+                    [str(job.input_path) for job in jobs],
+                    [str(job.output_dir) for job in jobs],
+                    [job.n_waves for job in jobs],
+                    [job.target_slots for job in jobs],  # Target slots for frequency mapping
                 ),
-                timeout=self._job_timeout_s,
+                timeout=timeout_s,
             )
 
-            if result.success:
-                logger.info(
-                    f"Decomposition complete: session={job.session_id}, "
-                    f"turn={job.turn_index}, file={job.input_path.name}, "
-                    f"rmse={result.rmse:.4f}, duration={result.duration_ms:.0f}ms"
-                )
-            else:
-                logger.warning(
-                    f"Decomposition failed: session={job.session_id}, "
-                    f"turn={job.turn_index}, file={job.input_path.name}, "
-                    f"error={result.error}"
-                )
-
-            # Notify the events orchestrator
-            if self._result_callback:
-                try:
-                    job_result = WavesJobResult(job=job, result=result)
-                    self._result_callback(job_result)
-                except Exception as e:
-                    logger.error(f"Error in result callback: {e}")
-
         except asyncio.TimeoutError:
             logger.warning(
-                f"Decomposition timeout: session={job.session_id}, "
-                f"turn={job.turn_index}, file={job.input_path.name}, "
-                f"timeout={self._job_timeout_s}s"
+                f"Decomposition timeout: jobs={len(jobs)}, files={_job_files(jobs)}, "
+                f"timeout={timeout_s}s"
             )
+            return
         except Exception as e:
             logger.error(
-                f"Decomposition error: session={job.session_id}, "
+                f"Decomposition error: jobs={len(jobs)}, files={_job_files(jobs)}, error={e}"
+            )
+            return
+
+        for job, result in zip(jobs, results):
+            self._handle_result(job, result)
+
+    def _handle_result(self, job: DecomposeJob, result: DecomposeResult) -> None:
+        """Log a finished job and notify the result callback.
+
+        Args:
+            job: The completed job
+            result: Its decomposition result
+        """
+        if result.success:
+            logger.info(
+                f"Decomposition complete: session={job.session_id}, "
+                f"turn={job.turn_index}, file={job.input_path.name}, "
+                f"rmse={result.rmse:.4f}, duration={result.duration_ms:.0f}ms"
+            )
+        else:
+            logger.warning(
+                f"Decomposition failed: session={job.session_id}, "
                 f"turn={job.turn_index}, file={job.input_path.name}, "
-                f"error={e}"
+                f"error={result.error}"
             )
 
+        # Notify the events orchestrator
+        if self._result_callback:
+            try:
+                job_result = WavesJobResult(job=job, result=result)
+                self._result_callback(job_result)
+            except Exception as e:
+                logger.error(f"Error in result callback: {e}")
+
 
 # Module-level singleton
 _worker_pool: WavesWorkerPool | None = None
@@ -285,6 +355,7 @@ def get_worker_pool() -> WavesWorkerPool:
             max_workers=settings.waves_max_workers,
             queue_max_size=settings.waves_queue_max_size,
             job_timeout_s=settings.waves_job_timeout_s,
+            batch_max=settings.waves_batch_max,
         )
     return _worker_pool
 
@@ -11,11 +11,14 @@ SSE events are emitted throughout for frontend consumption.
 import asyncio
 import logging
 import random
+import re
+import threading
+from collections import Counter, defaultdict
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from sse_starlette.sse import ServerSentEvent
-
 from backend.agents import get_llm, get_model_for_agent
 from backend.config import settings
 from backend.conversations import get_or_create_conversation
@@ -46,7 +49,9 @@ from backend.prompts import (
 )
 from backend.sentiment import analyze_sentiment, SentimentResult
 from backend.sessions import TTSSession
+from backend.sse import SSEChannel, encode_sse
 from backend.tts import MultiVoiceAgentTTS
+from backend.tts.elevenlabs_client import generate_pcm, get_client as get_elevenlabs_client
 from backend.waves import DecomposeJob, get_worker_pool, tts_path_to_waves_dir
 from backend.events import get_orchestrator, SlotMeta, DialogueSpec
 
@@ -61,6 +66,7 @@ MAX_COMMENTS_PER_TARGET = 3
 # =============================================================================
 
 _tts_client: MultiVoiceAgentTTS | None = None
+_tts_executor: ThreadPoolExecutor | None = None
 
 
 def get_tts() -> MultiVoiceAgentTTS:
@@ -72,6 +78,102 @@ def get_tts() -> MultiVoiceAgentTTS:
     return _tts_client
 
 
+def warm_up_tts(send_request: bool = False) -> None:
+    """Eagerly build the TTS singletons (and optionally prime the connection).
+
+    Called at startup so the first broadcast doesn't pay client construction
+    (or, with send_request, DNS/TLS setup) inside a slot task.
+    Blocking; run it in a thread.
+    """
+    tts = get_tts()
+    get_elevenlabs_client()
+    if send_request:
+        generate_pcm("Hi.", tts.get_profile(settings.tts_fallback_profile), settings.tts_output_format)
+        logger.info("TTS connection warmed up")
+
+
+def _get_tts_executor() -> ThreadPoolExecutor:
+    """Get or create the dedicated TTS thread pool (lazy singleton).
+
+    Kept separate from the default executor so TTS concurrency is bounded
+    by settings.tts_concurrency and doesn't compete with other to_thread work.
+    """
+    global _tts_executor
+    if _tts_executor is None:
+        _tts_executor = ThreadPoolExecutor(
+            max_workers=settings.tts_concurrency,
+            thread_name_prefix="tts",
+        )
+    return _tts_executor
+
+
+async def _prewarm_tts() -> None:
+    """Warm the TTS client and pool threads while Turn 1 LLM calls are in flight.
+
+    A no-op once the singletons exist; failures are left for the real TTS
+    call to surface as slot errors.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(_get_tts_executor(), warm_up_tts)
+    except Exception as e:
+        logger.debug(f"TTS pre-warm failed: {e}")
+
+
+def shutdown_tts_executor() -> None:
+    """Stop the TTS thread pool (call on application shutdown)."""
+    global _tts_executor
+    if _tts_executor is not None:
+        _tts_executor.shutdown(wait=False, cancel_futures=True)
+        _tts_executor = None
+
+
+def _synthesize_job(
+    text: str,
+    voice_profile: str,
+    audio_path: Path,
+    abandoned: threading.Event,
+) -> None:
+    """Synthesize to audio_path, then withdraw it if the caller gave up."""
+    # generate_wav_to_file publishes atomically (temp file + rename, or a cache link)
+    get_tts().generate_wav_to_file(text, voice_profile, audio_path)
+    if abandoned.is_set():
+        audio_path.unlink(missing_ok=True)
+
+
+async def _synthesize_to_file(text: str, voice_profile: str, audio_path: Path) -> None:
+    """Generate TTS audio to a WAV file on the TTS pool.
+
+    Raises asyncio.TimeoutError after settings.tts_timeout_s so a stuck
+    request fails the slot instead of stalling the turn. The pool thread
+    can't be interrupted, so a result that lands after a timeout or
+    cancellation is removed again: by the caller if it was already
+    published, otherwise by the thread itself.
+    """
+    loop = asyncio.get_running_loop()
+    abandoned = threading.Event()
+    try:
+        await asyncio.wait_for(
+            loop.run_in_executor(
+                _get_tts_executor(),
+                _synthesize_job,
+                text,
+                voice_profile,
+                audio_path,
+                abandoned,
+            ),
+            timeout=settings.tts_timeout_s,
+        )
+    except asyncio.TimeoutError as e:
+        abandoned.set()
+        audio_path.unlink(missing_ok=True)
+        raise asyncio.TimeoutError(f"TTS timed out after {settings.tts_timeout_s}s") from e
+    except asyncio.CancelledError:
+        abandoned.set()
+        audio_path.unlink(missing_ok=True)
+        raise
+
+
 # =============================================================================
 # Wave Decomposition Helper
 # =============================================================================
@@ -271,8 +373,9 @@ async def _run_sentiment_analysis(
 ) -> SentimentResult | None:
     """Run sentiment analysis and emit WebSocket event.
 
-    Called in parallel with Turn 1 to provide early mood indication
-    for TouchDesigner loading effects.
+    Runs in parallel with Turn 1 to provide early mood indication for
+    TouchDesigner loading effects; the workflow drops it if it hasn't
+    finished shortly after Turn 1.
 
     Args:
         state: Workflow state with session info
@@ -305,25 +408,66 @@ async def _run_sentiment_analysis(
 # =============================================================================
 
 
-def map_exception_to_error_type(e: Exception) -> str:
-    """Map exceptions to frontend ErrorType values."""
-    error_name = type(e).__name__.lower()
+# Checked in priority order against the lowercased exception class name
+_ERROR_NAME_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"timeout"), "timeout"),
+    (re.compile(r"rate_?limit"), "rate_limit"),
+    (re.compile(r"connection|network|dns|socket|refused"), "network"),
+)
+
+# Classification depends only on the exception type, so memoize per class
+_error_type_cache: dict[type[BaseException], str] = {}
+
 
-    if "timeout" in error_name or isinstance(e, asyncio.TimeoutError):
+def _classify_exception_type(exc_type: type[BaseException]) -> str:
+    error_name = exc_type.__name__.lower()
+
+    if issubclass(exc_type, asyncio.TimeoutError):
         return "timeout"
-    if "ratelimit" in error_name or "rate_limit" in error_name:
-        return "rate_limit"
-    if any(
-        term in error_name
-        for term in ["connection", "network", "dns", "socket", "refused"]
-    ):
-        return "network"
-    if isinstance(e, (ConnectionError, OSError)):
+    for pattern, error_type in _ERROR_NAME_PATTERNS:
+        if pattern.search(error_name):
+            return error_type
+    if issubclass(exc_type, (ConnectionError, OSError)):
         return "network"
 
     return "server_error"
 
 
+def map_exception_to_error_type(e: Exception) -> str:
+    """Map exceptions to frontend ErrorType values."""
+    exc_type = type(e)
+    error_type = _error_type_cache.get(exc_type)
+    if error_type is None:
+        error_type = _error_type_cache[exc_type] = _classify_exception_type(exc_type)
+    return error_type
+
+
+def _emit_slot_error(
+    channel: SSEChannel,
+    session_id: str,
+    turn_index: int,
+    kind: str,
+    slot_id: int,
+    agent_id: str,
+    error_type: str,
+    message: str,
+) -> None:
+    """Emit a slot.error event (shared by all turn processors)."""
+    channel.put(
+        encode_sse(
+            "slot.error",
+            SlotErrorEvent.model_construct(
+                sessionId=session_id,
+                turnIndex=turn_index,
+                kind=kind,
+                slotId=slot_id,
+                agentId=agent_id,
+                error=ErrorDetail.model_construct(type=error_type, message=message),
+            ),
+        )
+    )
+
+
 # =============================================================================
 # Turn 1: Response
 # =============================================================================
@@ -333,7 +477,7 @@ async def process_turn1_slot(
     state: WorkflowState,
     slot_id: int,
     agent_id: str,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> Turn1Result:
     """Process Turn 1 for a single slot: respond to user message.
 
@@ -341,7 +485,7 @@ async def process_turn1_slot(
         state: Workflow state with session and user_message
         slot_id: The slot ID (1-6)
         agent_id: The agent ID for this slot
-        queue: SSE event queue
+        channel: SSE event channel
 
     Returns:
         Turn1Result with success status and response data
@@ -351,16 +495,16 @@ async def process_turn1_slot(
 
     try:
         # Emit slot.start
-        await queue.put(
-            ServerSentEvent(
-                event="slot.start",
-                data=SlotStartEvent(
+        channel.put(
+            encode_sse(
+                "slot.start",
+                SlotStartEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=1,
                     kind="response",
                     slotId=slot_id,
                     agentId=agent_id,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -385,10 +529,10 @@ async def process_turn1_slot(
         conv.add_assistant(response.model_dump_json())
 
         # Emit slot.done
-        await queue.put(
-            ServerSentEvent(
-                event="slot.done",
-                data=SlotDoneEvent(
+        channel.put(
+            encode_sse(
+                "slot.done",
+                SlotDoneEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=1,
                     kind="response",
@@ -396,7 +540,7 @@ async def process_turn1_slot(
                     agentId=agent_id,
                     text=response.text,
                     voiceProfile=response.voice_profile,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -409,22 +553,21 @@ async def process_turn1_slot(
         audio_path = None
         relative_path = None
         try:
-            tts = get_tts()
-            audio_path = session.get_turn1_audio_path(slot_id, agent_id, response.voice_profile)
-            relative_path = session.get_turn1_relative_path(slot_id, agent_id, response.voice_profile)
+            audio_path, relative_path = session.get_turn1_paths(
+                slot_id, agent_id, response.voice_profile
+            )
 
-            await asyncio.to_thread(
-                tts.generate_wav_to_file,
+            await _synthesize_to_file(
                 response.text,
                 response.voice_profile,
                 audio_path,
             )
 
             # Emit slot.audio
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.audio",
-                    data=SlotAudioEvent(
+            channel.put(
+                encode_sse(
+                    "slot.audio",
+                    SlotAudioEvent.model_construct(
                         sessionId=session_id,
                         turnIndex=1,
                         kind="response",
@@ -432,7 +575,7 @@ async def process_turn1_slot(
                         agentId=agent_id,
                         voiceProfile=response.voice_profile,
                         audioPath=relative_path,
-                    ).model_dump_json(),
+                    ),
                 )
             )
 
@@ -460,18 +603,9 @@ async def process_turn1_slot(
 
         except Exception as tts_error:
             logger.error(f"Turn 1 Slot {slot_id} ({agent_id}) TTS error: {tts_error}")
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.error",
-                    data=SlotErrorEvent(
-                        sessionId=session_id,
-                        turnIndex=1,
-                        kind="response",
-                        slotId=slot_id,
-                        agentId=agent_id,
-                        error=ErrorDetail(type="tts_error", message=str(tts_error)),
-                    ).model_dump_json(),
-                )
+            _emit_slot_error(
+                channel, session_id, 1, "response", slot_id, agent_id,
+                "tts_error", str(tts_error),
             )
 
         return Turn1Result(
@@ -487,18 +621,9 @@ async def process_turn1_slot(
         error_type = map_exception_to_error_type(e)
         logger.error(f"Turn 1 Slot {slot_id} ({agent_id}) error: {error_type} - {e}")
 
-        await queue.put(
-            ServerSentEvent(
-                event="slot.error",
-                data=SlotErrorEvent(
-                    sessionId=session_id,
-                    turnIndex=1,
-                    kind="response",
-                    slotId=slot_id,
-                    agentId=agent_id,
-                    error=ErrorDetail(type=error_type, message=str(e)),
-                ).model_dump_json(),
-            )
+        _emit_slot_error(
+            channel, session_id, 1, "response", slot_id, agent_id,
+            error_type, str(e),
         )
 
         return Turn1Result(
@@ -512,50 +637,47 @@ async def process_turn1_slot(
 
 async def execute_turn1(
     state: WorkflowState,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> None:
     """Execute Turn 1 for all slots in parallel.
 
     Args:
         state: Workflow state (updated with turn1_results)
-        queue: SSE event queue
+        channel: SSE event channel
     """
     session_id = state.session.session_id
 
     # Emit turn.start
-    await queue.put(
-        ServerSentEvent(
-            event="turn.start",
-            data=TurnStartEvent(sessionId=session_id, turnIndex=1).model_dump_json(),
+    channel.put(
+        encode_sse(
+            "turn.start",
+            TurnStartEvent.model_construct(sessionId=session_id, turnIndex=1),
         )
     )
 
     # Process all slots in parallel
-    tasks = [
-        asyncio.create_task(
-            process_turn1_slot(state, slot.slotId, slot.agentId, queue)
-        )
-        for slot in state.slots
-    ]
-
-    results = await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(process_turn1_slot(state, slot.slotId, slot.agentId, channel))
+            for slot in state.slots
+        ]
 
-    # Store results
-    for result in results:
+    # Store results and count successful slots
+    successful_count = 0
+    for task in tasks:
+        result = task.result()
         state.turn1_results[result.slot_id] = result
-
-    # Count successful slots
-    successful_count = sum(1 for r in results if r.success)
+        successful_count += result.success
 
     # Emit turn.done
-    await queue.put(
-        ServerSentEvent(
-            event="turn.done",
-            data=TurnDoneEvent(
+    channel.put(
+        encode_sse(
+            "turn.done",
+            TurnDoneEvent.model_construct(
                 sessionId=session_id,
                 turnIndex=1,
                 slotCount=successful_count,
-            ).model_dump_json(),
+            ),
         )
     )
 
@@ -600,7 +722,7 @@ async def process_turn2_slot(
     state: WorkflowState,
     slot_id: int,
     agent_id: str,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> Turn2Result:
     """Process Turn 2 for a single slot: comment on a peer response.
 
@@ -608,7 +730,7 @@ async def process_turn2_slot(
         state: Workflow state with turn1_results
         slot_id: The slot ID (1-6)
         agent_id: The agent ID for this slot
-        queue: SSE event queue
+        channel: SSE event channel
 
     Returns:
         Turn2Result with comment data
@@ -618,16 +740,16 @@ async def process_turn2_slot(
 
     try:
         # Emit slot.start
-        await queue.put(
-            ServerSentEvent(
-                event="slot.start",
-                data=SlotStartEvent(
+        channel.put(
+            encode_sse(
+                "slot.start",
+                SlotStartEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=2,
                     kind="comment",
                     slotId=slot_id,
                     agentId=agent_id,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -655,10 +777,10 @@ async def process_turn2_slot(
         conv.add_assistant(response.model_dump_json())
 
         # Emit slot.done
-        await queue.put(
-            ServerSentEvent(
-                event="slot.done",
-                data=SlotDoneEvent(
+        channel.put(
+            encode_sse(
+                "slot.done",
+                SlotDoneEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=2,
                     kind="comment",
@@ -667,7 +789,7 @@ async def process_turn2_slot(
                     text=response.comment,
                     voiceProfile=response.voice_profile,
                     targetSlotId=response.targetSlotId,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -680,26 +802,21 @@ async def process_turn2_slot(
         audio_path = None
         relative_path = None
         try:
-            tts = get_tts()
-            audio_path = session.get_turn2_audio_path(
-                slot_id, response.targetSlotId, agent_id, response.voice_profile
-            )
-            relative_path = session.get_turn2_relative_path(
+            audio_path, relative_path = session.get_turn2_paths(
                 slot_id, response.targetSlotId, agent_id, response.voice_profile
             )
 
-            await asyncio.to_thread(
-                tts.generate_wav_to_file,
+            await _synthesize_to_file(
                 response.comment,
                 response.voice_profile,
                 audio_path,
             )
 
             # Emit slot.audio
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.audio",
-                    data=SlotAudioEvent(
+            channel.put(
+                encode_sse(
+                    "slot.audio",
+                    SlotAudioEvent.model_construct(
                         sessionId=session_id,
                         turnIndex=2,
                         kind="comment",
@@ -707,7 +824,7 @@ async def process_turn2_slot(
                         agentId=agent_id,
                         voiceProfile=response.voice_profile,
                         audioPath=relative_path,
-                    ).model_dump_json(),
+                    ),
                 )
             )
 
@@ -737,18 +854,9 @@ async def process_turn2_slot(
 
         except Exception as tts_error:
             logger.error(f"Turn 2 Slot {slot_id} ({agent_id}) TTS error: {tts_error}")
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.error",
-                    data=SlotErrorEvent(
-                        sessionId=session_id,
-                        turnIndex=2,
-                        kind="comment",
-                        slotId=slot_id,
-                        agentId=agent_id,
-                        error=ErrorDetail(type="tts_error", message=str(tts_error)),
-                    ).model_dump_json(),
-                )
+            _emit_slot_error(
+                channel, session_id, 2, "comment", slot_id, agent_id,
+                "tts_error", str(tts_error),
             )
 
         return Turn2Result(
@@ -765,18 +873,9 @@ async def process_turn2_slot(
         error_type = map_exception_to_error_type(e)
         logger.error(f"Turn 2 Slot {slot_id} ({agent_id}) error: {error_type} - {e}")
 
-        await queue.put(
-            ServerSentEvent(
-                event="slot.error",
-                data=SlotErrorEvent(
-                    sessionId=session_id,
-                    turnIndex=2,
-                    kind="comment",
-                    slotId=slot_id,
-                    agentId=agent_id,
-                    error=ErrorDetail(type=error_type, message=str(e)),
-                ).model_dump_json(),
-            )
+        _emit_slot_error(
+            channel, session_id, 2, "comment", slot_id, agent_id,
+            error_type, str(e),
         )
 
         return Turn2Result(
@@ -792,43 +891,49 @@ async def process_turn2_slot(
 def route_comments(state: WorkflowState) -> None:
     """Route Turn 2 comments to their targets, capping at MAX_COMMENTS_PER_TARGET.
 
+    Comments are capped in the same pass that groups them (reservoir
+    sampling), so each target keeps a uniform random subset.
+
     Populates state.comments_by_target with ReceivedComment objects.
     """
-    # Group comments by target
-    comments_by_target: dict[int, list[ReceivedComment]] = {}
+    comments_by_target: defaultdict[int, list[ReceivedComment]] = defaultdict(list)
+    received: Counter[int] = Counter()
 
     for result in state.turn2_results.values():
         if not result.success:
             continue
 
         target_id = result.target_slot_id
-        if target_id not in comments_by_target:
-            comments_by_target[target_id] = []
-
-        comments_by_target[target_id].append(
-            ReceivedComment(
-                from_slot_id=result.slot_id,
-                from_agent_id=result.agent_id,
-                comment=result.comment,
-            )
-        )
+        seen = received[target_id]
+        received[target_id] = seen + 1
 
-    # Cap comments per target
-    for target_id, comments in comments_by_target.items():
-        if len(comments) > MAX_COMMENTS_PER_TARGET:
-            # Randomly select which comments to keep
-            comments_by_target[target_id] = random.sample(comments, MAX_COMMENTS_PER_TARGET)
+        comment = ReceivedComment(
+            from_slot_id=result.slot_id,
+            from_agent_id=result.agent_id,
+            comment=result.comment,
+        )
+        kept = comments_by_target[target_id]
+        if seen < MAX_COMMENTS_PER_TARGET:
+            kept.append(comment)
+        else:
+            # Replace a kept comment with probability MAX / (seen + 1)
+            j = random.randint(0, seen)
+            if j < MAX_COMMENTS_PER_TARGET:
+                kept[j] = comment
+
+    for target_id, count in received.items():
+        if count > MAX_COMMENTS_PER_TARGET:
             logger.info(
-                f"Slot {target_id} received {len(comments)} comments, "
+                f"Slot {target_id} received {count} comments, "
                 f"capped to {MAX_COMMENTS_PER_TARGET}"
             )
 
-    state.comments_by_target = comments_by_target
+    state.comments_by_target = dict(comments_by_target)
 
 
 async def execute_turn2(
     state: WorkflowState,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> None:
     """Execute Turn 2 for all eligible slots in parallel.
 
@@ -836,14 +941,14 @@ async def execute_turn2(
 
     Args:
         state: Workflow state (updated with turn2_results and comments_by_target)
-        queue: SSE event queue
+        channel: SSE event channel
     """
     session_id = state.session.session_id
 
     # Filter to slots with successful Turn 1
     eligible_slots = [
         slot for slot in state.slots
-        if state.turn1_results.get(slot.slotId, Turn1Result(0, "", "", "", False)).success
+        if (turn1 := state.turn1_results.get(slot.slotId)) is not None and turn1.success
     ]
 
     if not eligible_slots:
@@ -851,42 +956,39 @@ async def execute_turn2(
         return
 
     # Emit turn.start
-    await queue.put(
-        ServerSentEvent(
-            event="turn.start",
-            data=TurnStartEvent(sessionId=session_id, turnIndex=2).model_dump_json(),
+    channel.put(
+        encode_sse(
+            "turn.start",
+            TurnStartEvent.model_construct(sessionId=session_id, turnIndex=2),
         )
     )
 
     # Process all eligible slots in parallel
-    tasks = [
-        asyncio.create_task(
-            process_turn2_slot(state, slot.slotId, slot.agentId, queue)
-        )
-        for slot in eligible_slots
-    ]
-
-    results = await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(process_turn2_slot(state, slot.slotId, slot.agentId, channel))
+            for slot in eligible_slots
+        ]
 
-    # Store results
-    for result in results:
+    # Store results and count successful slots
+    successful_count = 0
+    for task in tasks:
+        result = task.result()
         state.turn2_results[result.slot_id] = result
+        successful_count += result.success
 
     # Route comments to targets
     route_comments(state)
 
-    # Count successful slots
-    successful_count = sum(1 for r in results if r.success)
-
     # Emit turn.done
-    await queue.put(
-        ServerSentEvent(
-            event="turn.done",
-            data=TurnDoneEvent(
+    channel.put(
+        encode_sse(
+            "turn.done",
+            TurnDoneEvent.model_construct(
                 sessionId=session_id,
                 turnIndex=2,
                 slotCount=successful_count,
-            ).model_dump_json(),
+            ),
         )
     )
 
@@ -903,7 +1005,7 @@ async def process_turn3_slot(
     slot_id: int,
     agent_id: str,
     received_comments: list[ReceivedComment],
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> Turn3Result:
     """Process Turn 3 for a single slot: reply to received comments.
 
@@ -912,7 +1014,7 @@ async def process_turn3_slot(
         slot_id: The slot ID (1-6)
         agent_id: The agent ID for this slot
         received_comments: Comments received by this slot
-        queue: SSE event queue
+        channel: SSE event channel
 
     Returns:
         Turn3Result with reply data
@@ -922,16 +1024,16 @@ async def process_turn3_slot(
 
     try:
         # Emit slot.start
-        await queue.put(
-            ServerSentEvent(
-                event="slot.start",
-                data=SlotStartEvent(
+        channel.put(
+            encode_sse(
+                "slot.start",
+                SlotStartEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=3,
                     kind="reply",
                     slotId=slot_id,
                     agentId=agent_id,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -944,15 +1046,8 @@ async def process_turn3_slot(
         turn1_result = state.turn1_results[slot_id]
         original_response = turn1_result.text
 
-        # Format comments for prompt
-        comments_list = [
-            {
-                "fromSlotId": c.from_slot_id,
-                "fromAgentId": c.from_agent_id,
-                "comment": c.comment,
-            }
-            for c in received_comments
-        ]
+        # Format comments for prompt (also recorded in the manifest)
+        comments_list = [c.to_prompt_dict() for c in received_comments]
 
         # Render prompt
         prompt = render_turn3_prompt(slot_id, agent_id, original_response, comments_list)
@@ -970,10 +1065,10 @@ async def process_turn3_slot(
         conv.add_assistant(response.model_dump_json())
 
         # Emit slot.done
-        await queue.put(
-            ServerSentEvent(
-                event="slot.done",
-                data=SlotDoneEvent(
+        channel.put(
+            encode_sse(
+                "slot.done",
+                SlotDoneEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=3,
                     kind="reply",
@@ -981,7 +1076,7 @@ async def process_turn3_slot(
                     agentId=agent_id,
                     text=response.text,
                     voiceProfile=response.voice_profile,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -994,22 +1089,21 @@ async def process_turn3_slot(
         audio_path = None
         relative_path = None
         try:
-            tts = get_tts()
-            audio_path = session.get_turn3_audio_path(slot_id, agent_id, response.voice_profile)
-            relative_path = session.get_turn3_relative_path(slot_id, agent_id, response.voice_profile)
+            audio_path, relative_path = session.get_turn3_paths(
+                slot_id, agent_id, response.voice_profile
+            )
 
-            await asyncio.to_thread(
-                tts.generate_wav_to_file,
+            await _synthesize_to_file(
                 response.text,
                 response.voice_profile,
                 audio_path,
             )
 
             # Emit slot.audio
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.audio",
-                    data=SlotAudioEvent(
+            channel.put(
+                encode_sse(
+                    "slot.audio",
+                    SlotAudioEvent.model_construct(
                         sessionId=session_id,
                         turnIndex=3,
                         kind="reply",
@@ -1017,7 +1111,7 @@ async def process_turn3_slot(
                         agentId=agent_id,
                         voiceProfile=response.voice_profile,
                         audioPath=relative_path,
-                    ).model_dump_json(),
+                    ),
                 )
             )
 
@@ -1046,18 +1140,9 @@ async def process_turn3_slot(
 
         except Exception as tts_error:
             logger.error(f"Turn 3 Slot {slot_id} ({agent_id}) TTS error: {tts_error}")
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.error",
-                    data=SlotErrorEvent(
-                        sessionId=session_id,
-                        turnIndex=3,
-                        kind="reply",
-                        slotId=slot_id,
-                        agentId=agent_id,
-                        error=ErrorDetail(type="tts_error", message=str(tts_error)),
-                    ).model_dump_json(),
-                )
+            _emit_slot_error(
+                channel, session_id, 3, "reply", slot_id, agent_id,
+                "tts_error", str(tts_error),
             )
 
         return Turn3Result(
@@ -1073,18 +1158,9 @@ async def process_turn3_slot(
         error_type = map_exception_to_error_type(e)
         logger.error(f"Turn 3 Slot {slot_id} ({agent_id}) error: {error_type} - {e}")
 
-        await queue.put(
-            ServerSentEvent(
-                event="slot.error",
-                data=SlotErrorEvent(
-                    sessionId=session_id,
-                    turnIndex=3,
-                    kind="reply",
-                    slotId=slot_id,
-                    agentId=agent_id,
-                    error=ErrorDetail(type=error_type, message=str(e)),
-                ).model_dump_json(),
-            )
+        _emit_slot_error(
+            channel, session_id, 3, "reply", slot_id, agent_id,
+            error_type, str(e),
         )
 
         return Turn3Result(
@@ -1098,7 +1174,7 @@ async def process_turn3_slot(
 
 async def execute_turn3(
     state: WorkflowState,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> None:
     """Execute Turn 3 for slots that received comments.
 
@@ -1106,7 +1182,7 @@ async def execute_turn3(
 
     Args:
         state: Workflow state (updated with turn3_results)
-        queue: SSE event queue
+        channel: SSE event channel
     """
     session_id = state.session.session_id
 
@@ -1123,39 +1199,36 @@ async def execute_turn3(
         return
 
     # Emit turn.start
-    await queue.put(
-        ServerSentEvent(
-            event="turn.start",
-            data=TurnStartEvent(sessionId=session_id, turnIndex=3).model_dump_json(),
+    channel.put(
+        encode_sse(
+            "turn.start",
+            TurnStartEvent.model_construct(sessionId=session_id, turnIndex=3),
         )
     )
 
     # Process all slots with comments in parallel
-    tasks = [
-        asyncio.create_task(
-            process_turn3_slot(state, slot.slotId, slot.agentId, comments, queue)
-        )
-        for slot, comments in slots_with_comments
-    ]
-
-    results = await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(process_turn3_slot(state, slot.slotId, slot.agentId, comments, channel))
+            for slot, comments in slots_with_comments
+        ]
 
-    # Store results
-    for result in results:
+    # Store results and count successful slots
+    successful_count = 0
+    for task in tasks:
+        result = task.result()
         state.turn3_results[result.slot_id] = result
-
-    # Count successful slots
-    successful_count = sum(1 for r in results if r.success)
+        successful_count += result.success
 
     # Emit turn.done
-    await queue.put(
-        ServerSentEvent(
-            event="turn.done",
-            data=TurnDoneEvent(
+    channel.put(
+        encode_sse(
+            "turn.done",
+            TurnDoneEvent.model_construct(
                 sessionId=session_id,
                 turnIndex=3,
                 slotCount=successful_count,
-            ).model_dump_json(),
+            ),
         )
     )
 
@@ -1213,7 +1286,7 @@ def _collect_all_responses(state: WorkflowState) -> list[dict]:
 
 async def execute_summary(
     state: WorkflowState,
-    queue: asyncio.Queue[ServerSentEvent],
+    channel: SSEChannel,
 ) -> SummaryResult:
     """Execute Turn 4: Generate summary of all responses.
 
@@ -1221,7 +1294,7 @@ async def execute_summary(
 
     Args:
         state: Workflow state with turn results
-        queue: SSE event queue for frontend updates
+        channel: SSE channel for frontend updates
 
     Returns:
         SummaryResult with success status and response data
@@ -1230,10 +1303,10 @@ async def execute_summary(
     session_id = session.session_id
 
     # Emit turn.start for Turn 4
-    await queue.put(
-        ServerSentEvent(
-            event="turn.start",
-            data=TurnStartEvent(sessionId=session_id, turnIndex=4).model_dump_json(),
+    channel.put(
+        encode_sse(
+            "turn.start",
+            TurnStartEvent.model_construct(sessionId=session_id, turnIndex=4),
         )
     )
 
@@ -1246,16 +1319,16 @@ async def execute_summary(
             return SummaryResult(text="", voice_profile="", success=False)
 
         # Emit slot.start for summary (slotId=0 for summary)
-        await queue.put(
-            ServerSentEvent(
-                event="slot.start",
-                data=SlotStartEvent(
+        channel.put(
+            encode_sse(
+                "slot.start",
+                SlotStartEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=4,
                     kind="summary",
                     slotId=0,
                     agentId="gpt-4o",
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -1286,10 +1359,10 @@ async def execute_summary(
         )
 
         # Emit slot.done for summary
-        await queue.put(
-            ServerSentEvent(
-                event="slot.done",
-                data=SlotDoneEvent(
+        channel.put(
+            encode_sse(
+                "slot.done",
+                SlotDoneEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=4,
                     kind="summary",
@@ -1297,7 +1370,7 @@ async def execute_summary(
                     agentId="gpt-4o",
                     text=response.text,
                     voiceProfile=response.voice_profile,
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -1305,12 +1378,9 @@ async def execute_summary(
         audio_path = None
         relative_path = None
         try:
-            tts = get_tts()
-            audio_path = session.get_summary_audio_path(response.voice_profile)
-            relative_path = session.get_summary_relative_path(response.voice_profile)
+            audio_path, relative_path = session.get_summary_paths(response.voice_profile)
 
-            await asyncio.to_thread(
-                tts.generate_wav_to_file,
+            await _synthesize_to_file(
                 response.text,
                 response.voice_profile,
                 audio_path,
@@ -1319,10 +1389,10 @@ async def execute_summary(
             logger.info(f"Summary TTS done: {audio_path.name}")
 
             # Emit slot.audio for summary
-            await queue.put(
-                ServerSentEvent(
-                    event="slot.audio",
-                    data=SlotAudioEvent(
+            channel.put(
+                encode_sse(
+                    "slot.audio",
+                    SlotAudioEvent.model_construct(
                         sessionId=session_id,
                         turnIndex=4,
                         kind="summary",
@@ -1330,7 +1400,7 @@ async def execute_summary(
                         agentId="gpt-4o",
                         voiceProfile=response.voice_profile,
                         audioPath=relative_path,
-                    ).model_dump_json(),
+                    ),
                 )
             )
 
@@ -1363,14 +1433,14 @@ async def execute_summary(
             )
 
         # Emit turn.done for Turn 4
-        await queue.put(
-            ServerSentEvent(
-                event="turn.done",
-                data=TurnDoneEvent(
+        channel.put(
+            encode_sse(
+                "turn.done",
+                TurnDoneEvent.model_construct(
                     sessionId=session_id,
                     turnIndex=4,
                     slotCount=1,  # Summary is always 1 "slot"
-                ).model_dump_json(),
+                ),
             )
         )
 
@@ -1394,7 +1464,7 @@ async def execute_summary(
 async def run_three_turn_workflow(
     message: str,
     slots: list[SlotRequest],
-) -> AsyncGenerator[ServerSentEvent, None]:
+) -> AsyncGenerator[bytes, None]:
     """Run the complete 3-turn workflow.
 
     Args:
@@ -1405,7 +1475,7 @@ async def run_three_turn_workflow(
         SSE events for all turns
     """
     # Create session
-    session = TTSSession.create()
+    session = await TTSSession.acreate()
     logger.info(f"Created TTS session: {session.session_id}")
 
     # Initialize workflow state
@@ -1418,86 +1488,82 @@ async def run_three_turn_workflow(
     # Notify events orchestrator of session start (for TouchDesigner WebSocket)
     _notify_events_begin_session(state)
 
-    # Create event queue
-    queue: asyncio.Queue[ServerSentEvent] = asyncio.Queue()
+    # Create event channel (all slot tasks write, this generator drains)
+    channel = SSEChannel()
 
     # Run workflow in background task
     async def run_workflow():
         try:
-            # Run sentiment analysis in parallel with Turn 1
-            # Sentiment is fast (~1s) and emits user_sentiment event early
-            sentiment_task = asyncio.create_task(
-                _run_sentiment_analysis(state, message)
-            )
+            # Sentiment and TTS pre-warm run in parallel with Turn 1 in the
+            # same task scope, so a workflow error or client disconnect
+            # cancels them too
+            async with asyncio.TaskGroup() as tg:
+                sentiment_task = tg.create_task(
+                    _run_sentiment_analysis(state, message)
+                )
 
-            # Turn 1: All slots respond to user
-            await execute_turn1(state, queue)
+                # Overlap TTS client setup with the Turn 1 LLM calls
+                tg.create_task(_prewarm_tts())
 
-            # Ensure sentiment completes (don't block if failed)
-            try:
-                await asyncio.wait_for(sentiment_task, timeout=1.0)
-            except asyncio.TimeoutError:
-                logger.warning("Sentiment task didn't complete in time after Turn 1")
+                # Turn 1: All slots respond to user
+                await execute_turn1(state, channel)
+
+                # The mood cue is only useful early: join it shortly after
+                # Turn 1 or drop it (wait_for cancels it on timeout)
+                try:
+                    await asyncio.wait_for(sentiment_task, timeout=1.0)
+                except asyncio.TimeoutError:
+                    logger.warning("Sentiment task didn't complete in time after Turn 1")
 
             # Turn 2: Each slot comments on one peer
-            await execute_turn2(state, queue)
+            await execute_turn2(state, channel)
 
             # Turn 3: Slots with comments reply
-            await execute_turn3(state, queue)
+            await execute_turn3(state, channel)
 
             # Turn 4: Summary (runs after Turn 3)
             if settings.summary_enabled:
-                state.summary_result = await execute_summary(state, queue)
+                state.summary_result = await execute_summary(state, channel)
                 logger.info(
                     f"Summary complete: success={state.summary_result.success}"
                 )
 
-            # Write manifest
-            manifest_path = session.write_manifest()
+            # Write manifest (off the event loop)
+            manifest_path = await asyncio.to_thread(session.write_manifest)
             logger.info(f"Manifest written: {manifest_path}")
 
         except Exception as e:
             logger.error(f"Workflow error: {e}")
         finally:
             # Signal completion
-            await queue.put(None)
+            channel.close()
 
     # Start workflow
-    asyncio.create_task(run_workflow())
-
-    # Track completion stats
-    completed_slots = 0
-    counted_slots: set[int] = set()
+    workflow_task = asyncio.create_task(run_workflow())
 
-    # Yield events as they arrive
-    while True:
-        event = await queue.get()
-
-        if event is None:
-            break
-
-        yield event
+    # Yield pre-encoded SSE frames as they arrive. If the client disconnects,
+    # the generator is closed here and the workflow (with any in-flight slot
+    # tasks in its TaskGroups) is cancelled instead of spending LLM/TTS quota.
+    try:
+        async for frame in channel.frames():
+            yield frame
+    finally:
+        if not workflow_task.done():
+            workflow_task.cancel()
+            logger.info(f"Client disconnected, cancelled workflow: {session.session_id}")
 
-        # Track slot completions (for final event)
-        if event.event == "slot.done":
-            import json
-            data = json.loads(event.data)
-            slot_id = data.get("slotId")
-            turn_index = data.get("turnIndex")
-            # Only count Turn 1 completions for total
-            if turn_index == 1 and slot_id not in counted_slots:
-                counted_slots.add(slot_id)
-                completed_slots += 1
+    # Only Turn 1 completions count toward the total
+    completed_slots = sum(1 for r in state.turn1_results.values() if r.success)
 
     # Emit final done event
     turn_count = 4 if settings.summary_enabled else 3
-    yield ServerSentEvent(
-        event="done",
-        data=DoneEvent(
+    yield encode_sse(
+        "done",
+        DoneEvent.model_construct(
             sessionId=session.session_id,
             completedSlots=completed_slots,
             turns=turn_count,
-        ).model_dump_json(),
+        ),
     )
 
     logger.info(
@@ -0,0 +1,231 @@
+import hashlib
+import librosa
+import numpy as np
+import soundfile as sf
+import os
+from numba import njit
+from numpy.lib.stride_tricks import sliding_window_view
+
+# On-disk cache of pyin contours, shared by every harmonic count. It lives
+# next to this script regardless of the working directory, and the least
+# recently used contours are evicted beyond PYIN_CACHE_MAX_ENTRIES.
+PYIN_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache_pyin")
+PYIN_CACHE_MAX_ENTRIES = 256
+
+def evict_pyin_cache():
+    """Remove the least recently used contours beyond PYIN_CACHE_MAX_ENTRIES."""
+    with os.scandir(PYIN_CACHE_DIR) as it:
+        entries = [e for e in it if e.name.endswith(".npy")]
+    if len(entries) <= PYIN_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - PYIN_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # Evicted by a concurrent run
+
+def cached_pyin(y, sr, hop_length, fmin, fmax):
+    """
+    librosa.pyin f0 contour, cached on disk by audio content and parameters,
+    so re-running on the same input (e.g. v3 then v4) skips pitch tracking.
+    """
+    key = hashlib.blake2b(y.tobytes(), digest_size=16)
+    key.update(f"{sr}_{hop_length}_{fmin}_{fmax}_{librosa.__version__}".encode())
+    cache_path = os.path.join(PYIN_CACHE_DIR, f"{key.hexdigest()}.npy")
+    try:
+        f0 = np.load(cache_path)
+        os.utime(cache_path)  # Mark as recently used for eviction
+        return f0
+    except (OSError, ValueError, EOFError):
+        pass  # Missing or unreadable entry: recompute it
+
+    f0, voiced_flag, voiced_probs = librosa.pyin(y, fmin=fmin, fmax=fmax, sr=sr, hop_length=hop_length)
+    os.makedirs(PYIN_CACHE_DIR, exist_ok=True)
+    # Write under a per-process temp name and rename, so a crash or a
+    # concurrent run never leaves a truncated entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, f0)
+    os.replace(tmp_path, cache_path)
+    evict_pyin_cache()
+    return f0
+
+@njit(cache=True)
+def synth_cos(freq_curve, amplitude_env, sr):
+    """
+    amplitude_env * cos(cumulative phase of freq_curve), fused into one pass:
+    the phase is carried in a register instead of a full-length cumsum array.
+    """
+    out = np.empty_like(amplitude_env)
+    rad_per_hz = 2 * np.pi / sr
+    phase = 0.0
+    for i in range(freq_curve.shape[0]):
+        phase += freq_curve[i] * rad_per_hz
+        out[i] = amplitude_env[i] * np.cos(phase)
+    return out
+
+def calculate_envelope(signal, frame_length=512, hop_length=128):
+    """
+    Windowed RMS envelope, framed like librosa.feature.rms(center=True).
+    Frames are a zero-copy strided view and the sum of squares is one einsum,
+    so no framed copy or squared temporary is allocated.
+    """
+    padded = np.pad(signal, frame_length // 2)
+    frames = sliding_window_view(padded, frame_length)[::hop_length]
+    return np.sqrt(np.einsum('ij,ij->i', frames, frames) / frame_length)
+
+def extract_all_harmonics(S, f0_clean, sr, n_fft, harmonics, times_samples, times_frames):
+    """
+    Amplitude envelopes of several harmonics of f0, interpolated to sample rate.
+    All harmonics are gathered from S in one pass and share a single
+    frame->sample interpolation search. Returns an array of shape (H, T).
+    """
+    harmonics = np.asarray(harmonics)
+    target_f = f0_clean[None, :] * harmonics[:, None]
+    bin_idx = np.round(target_f / (sr / n_fft)).astype(int)
+    bin_idx = np.clip(bin_idx, 0, S.shape[0] - 1)
+    frame_indices = np.arange(len(f0_clean))
+    amps = S[bin_idx, frame_indices] * (f0_clean > 0)
+
+    # Same result as np.interp(times_samples, times_frames, row) for each row
+    hi = np.clip(np.searchsorted(times_frames, times_samples), 1, len(times_frames) - 1)
+    lo = hi - 1
+    frac = (times_samples - times_frames[lo]) / (times_frames[hi] - times_frames[lo])
+    frac = np.clip(frac, 0.0, 1.0).astype(np.float32)
+    amp_interp = amps[:, lo] + frac * (amps[:, hi] - amps[:, lo])
+
+    # Base normalization (start with x3.0 gain as a baseline)
+    normalization = (2 / n_fft) * 3.0
+    return amp_interp * normalization
+
+def decompose_audio(input_file, n_harmonics=3, compute_extra_metrics=False,
+                    save_files=True, output_dir="output_waves", tag="v3"):
+    """
+    Dynamic Amplitude Matching decomposition into n_harmonics cosine waves
+    (fundamental + harmonics) driven by the pitch contour mapped to 15-80Hz.
+    Uses dynamic gain to force the mix envelope to match the original envelope.
+
+    Always computes RMSE; compute_extra_metrics adds NRMSE, SNR and envelope
+    correlation. Waves are saved as <name>_<tag>_wave<N>.wav.
+
+    Returns:
+        y, sr, waves (list of n_harmonics arrays), mix, metrics (dict)
+    """
+    
+    print(f"Loading audio: {input_file}")
+    processing_sr = 8000
+    # All signal arrays are float32; only time axes stay float64
+    y, sr = librosa.load(input_file, sr=processing_sr, dtype=np.float32)
+    
+    print(f"Extracting pitch (f0) at {sr}Hz...")
+    hop_length = 128
+    f0 = cached_pyin(y, sr, hop_length, fmin=librosa.note_to_hz('C2'), fmax=librosa.note_to_hz('C7'))
+    f0_clean = np.nan_to_num(f0).astype(np.float32)
+    
+    # Interpolate f0
+    times_samples = np.arange(len(y)) / sr
+    times_frames = librosa.frames_to_time(np.arange(len(f0)), sr=sr, hop_length=hop_length)
+    f0_interp = np.interp(times_samples, times_frames, f0_clean).astype(np.float32)
+    
+    # --- Frequency Mapping Logic (15Hz - 80Hz) ---
+    print("Mapping frequencies to 15-80Hz range...")
+    valid_f0 = f0_clean[f0_clean > 0]
+    if len(valid_f0) > 0:
+        min_f0 = np.min(valid_f0)
+        max_f0 = np.max(valid_f0)
+        if max_f0 == min_f0: max_f0 += 1.0
+        
+        f0_mapped = np.zeros_like(f0_interp)
+        mask = f0_interp > 0
+        f0_mapped[mask] = 15.0 + (f0_interp[mask] - min_f0) / (max_f0 - min_f0) * (80.0 - 15.0)
+    else:
+        f0_mapped = f0_interp
+        
+    print(f"Extracting harmonic amplitudes (STFT)...")
+    n_fft = 512
+    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
+    
+    harmonics = range(1, n_harmonics + 1)
+    amps = extract_all_harmonics(
+        S, f0_clean, sr, n_fft, harmonics, times_samples, times_frames
+    )
+
+    print(f"Synthesizing Base Waves ({n_harmonics} harmonics)...")
+    
+    def synthesize_raw(freq_multiplier, amplitude_env):
+        freq_curve = f0_mapped * freq_multiplier
+        return synth_cos(freq_curve, amplitude_env, sr)
+    
+    raw_waves = [synthesize_raw(h, amps[h - 1]) for h in harmonics]
+    
+    raw_mix = sum(raw_waves)
+    
+    # --- Dynamic Amplitude Matching ---
+    print("Calculating Dynamic Gain Optimization...")
+    
+    # 1. Calculate Envelopes
+    # We use a simple windowed RMS for envelope comparison (calculate_envelope)
+    # Get envelopes at frame rate
+    env_original_frames = calculate_envelope(y)
+    env_mix_frames = calculate_envelope(raw_mix)
+    
+    # Avoid division by zero
+    epsilon = 1e-8
+    gain_curve_frames = env_original_frames / (env_mix_frames + epsilon)
+    
+    # Interpolate gain curve to sample level
+    # Reuse times_frames from earlier which matches hop_length=128
+    gain_curve = np.interp(times_samples, times_frames, gain_curve_frames).astype(np.float32)
+    
+    # Apply Gain Curve
+    # We cap the gain to avoid exploding on silence/noise (e.g. max x10 gain)
+    gain_curve = np.clip(gain_curve, 0, 10.0)
+    
+    waves = [raw_wave * gain_curve for raw_wave in raw_waves]
+    mix = sum(waves)
+    
+    # --- Calculate Loss Metrics ---
+    # 1. RMSE
+    mse = np.mean((y - mix) ** 2)
+    rmse = np.sqrt(mse)
+    metrics = {'rmse': rmse}
+    
+    if compute_extra_metrics:
+        # 2. Normalized RMSE (relative to signal std)
+        nrmse = rmse / (np.std(y) + 1e-10)
+        
+        # 3. Signal-to-Noise Ratio (dB)
+        signal_power = np.mean(y ** 2)
+        noise_power = mse  # same as np.mean((y - mix) ** 2)
+        snr_db = 10 * np.log10(signal_power / (noise_power + 1e-10))
+        
+        # 4. Envelope Correlation
+        env_mix_final = calculate_envelope(mix)
+        # Align lengths if needed
+        min_len = min(len(env_original_frames), len(env_mix_final))
+        env_corr = np.corrcoef(env_original_frames[:min_len], env_mix_final[:min_len])[0, 1]
+        
+        metrics.update(nrmse=nrmse, snr_db=snr_db, env_corr=env_corr)
+        
+        print(f"Optimization Complete:")
+        print(f"  RMSE: {rmse:.6f}")
+        print(f"  NRMSE: {nrmse:.4f} ({nrmse*100:.1f}% error)")
+        print(f"  SNR: {snr_db:.2f} dB")
+        print(f"  Envelope Correlation: {env_corr:.4f}")
+    else:
+        print(f"Optimization Complete. RMSE Loss: {rmse:.6f}")
+    
+    # Save files
+    if save_files:
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+            
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
+        
+        for h, wave in zip(harmonics, waves):
+            sf.write(os.path.join(output_dir, f"{base_name}_{tag}_wave{h}.wav"), wave, sr)
+        
+        print(f"Done! Output saved to {output_dir}")
+
+    return y, sr, waves, mix, metrics